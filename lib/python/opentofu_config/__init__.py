@@ -16,6 +16,7 @@ Example usage:
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict
 
 from repo_utils import REPO_ROOT as _REPO_ROOT
@@ -91,8 +92,12 @@ def get_shared_config() -> Dict[str, Any]:
 TEST_AWS_REGION = parse_locals().get("aws_region", "us-east-2")
 
 
+@lru_cache(maxsize=1)
 def get_resource_prefix() -> str:
-    """Get the resource prefix from shared OpenTofu module."""
+    """Get the resource prefix from shared OpenTofu module.
+
+    Cached, since locals.tf does not change during a run.
+    """
     return parse_locals().get("resource_prefix", "DeltaHDL")
 
 
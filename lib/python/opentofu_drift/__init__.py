@@ -8,23 +8,37 @@ in OpenTofu state. This catches scenarios where:
 - Resources exist from a previous deployment that wasn't imported
 
 Example usage:
-    from opentofu_drift import check_resource_exists, get_planned_creates
+    from opentofu_drift import (
+        check_resource_exists, check_resources_exist, get_planned_creates,
+    )
 
     exists = check_resource_exists('aws_s3_bucket', 'my-bucket', 'us-east-2')
     creates = get_planned_creates('/path/to/opentofu/dir')
+    existence = check_resources_exist(creates, 'us-east-2')
 """
 
 import json
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, cast
+from typing import Any, Callable, Dict, List, Tuple, cast
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 
 ResourceChecker = Callable[[Any, str], bool]
 
+# Existence checks are network-bound, so they are run concurrently. Clients
+# are shared across threads and need a connection pool at least this large.
+MAX_CHECK_WORKERS = 16
+
+_CLIENT_CONFIG = Config(max_pool_connections=MAX_CHECK_WORKERS)
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
 
 def _check_iam_role(client: Any, name: str) -> bool:
     """Check if IAM role exists."""
@@ -79,6 +93,21 @@ RESOURCE_TO_CLIENT: Dict[str, str] = {
 }
 
 
+def _get_client(client_name: str, region: str) -> Any:
+    """Get a shared boto3 client for the service and region.
+
+    Client creation from the default session is not thread-safe, so it is
+    serialized; the clients themselves are safe to share across threads.
+    """
+    key = (client_name, region)
+    with _CLIENTS_LOCK:
+        if key not in _CLIENTS:
+            _CLIENTS[key] = cast(Any, boto3).client(
+                client_name, region_name=region, config=_CLIENT_CONFIG
+            )
+        return _CLIENTS[key]
+
+
 def get_supported_resource_types() -> List[str]:
     """Get list of resource types that can be checked for drift."""
     return list(RESOURCE_CHECKERS.keys())
@@ -108,13 +137,37 @@ def check_resource_exists(
             f"Supported types: {', '.join(RESOURCE_CHECKERS.keys())}"
         )
 
-    client_name = RESOURCE_TO_CLIENT[resource_type]
-    client = cast(Any, boto3).client(client_name, region_name=region)
+    client = _get_client(RESOURCE_TO_CLIENT[resource_type], region)
     checker = RESOURCE_CHECKERS[resource_type]
 
     return checker(client, resource_name)
 
 
+def check_resources_exist(
+    resources: List[Dict[str, Any]],
+    region: str = "us-east-2",
+) -> List[bool]:
+    """Check concurrently whether each resource exists in AWS.
+
+    Args:
+        resources: Dicts with 'type' and 'name' keys (as from get_planned_creates)
+        region: AWS region to check in
+
+    Returns:
+        List of existence flags in the same order as resources.
+    """
+    if not resources:
+        return []
+
+    with ThreadPoolExecutor(max_workers=MAX_CHECK_WORKERS) as executor:
+        return list(executor.map(
+            lambda resource: check_resource_exists(
+                resource["type"], resource["name"], region
+            ),
+            resources,
+        ))
+
+
 def get_planned_creates(
     opentofu_dir: Path,
     timeout: int = 120,
@@ -219,10 +272,11 @@ def find_orphaned_resources(
         List of dicts with keys: type, name, address, import_command
     """
     planned = get_planned_creates(opentofu_dir)
+    existence = check_resources_exist(planned, region)
     orphaned = []
 
-    for resource in planned:
-        if check_resource_exists(resource["type"], resource["name"], region):
+    for resource, exists in zip(planned, existence):
+        if exists:
             orphaned.append({
                 "type": resource["type"],
                 "name": resource["name"],
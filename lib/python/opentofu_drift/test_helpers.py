@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from opentofu_drift import (
-    check_resource_exists,
+    check_resources_exist,
     get_planned_creates,
 )
 
@@ -60,12 +60,12 @@ def create_orphaned_resource_tests(
                 return
 
             orphaned = []
-            for resource in creates:
+            existence = check_resources_exist(creates, region)
+            for resource, exists in zip(creates, existence):
                 resource_type = resource["type"]
                 name = resource["name"]
                 tf_address = resource["address"]
-                print(f"\nChecking {resource_type}: {name}")
-                exists = check_resource_exists(resource_type, name, region)
+                print(f"\nChecked {resource_type}: {name}")
                 print(f"  Exists in AWS: {exists}")
                 if exists:
                     orphaned.append((resource_type, name, tf_address))
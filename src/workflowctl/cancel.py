@@ -19,22 +19,42 @@ Exit codes:
 No stdout output. Errors go to stderr.
 """
 import argparse
+import re
 import subprocess
 import sys
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
 
 from compute_roots import compute_merge_roots, load_graph_and_compute_roots
 from utils import (
     add_changed_files_arg,
     add_running_arg,
     build_name_to_key_map,
+    collect_with_descendants,
     create_base_parser,
-    get_all_descendants,
     get_workflow_runs,
     parse_changed_files,
     parse_running_workflows,
 )
 
+# gh run cancel spends nearly all its time waiting on the network, so a
+# small thread pool overlaps those waits without hammering the API
+MAX_CANCEL_WORKERS = 8
+
+# gh stderr wording for runs that finished before they could be cancelled
+_ALREADY_DONE_RE = re.compile(
+    r"cannot be cancell?ed|not in progress|already (?:completed|cancell?ed)",
+    re.IGNORECASE,
+)
+
+
+class CancelableRun(NamedTuple):
+    """The fields of a workflow run needed to decide on and cancel it."""
+
+    id: int
+    name: str
+    run_number: int
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -48,22 +68,23 @@ def get_workflows_to_cancel(
     merge_roots: list[str], graph: dict[str, Any]
 ) -> set[str]:
     """Get all workflows that should be canceled (merge roots + descendants)."""
-    to_cancel: set[str] = set(merge_roots)
-    descendant_cache: dict[str, set[str]] = {}
+    return collect_with_descendants(merge_roots, graph)
 
-    for root in merge_roots:
-        to_cancel.update(get_all_descendants(root, graph, descendant_cache))
 
-    return to_cancel
+def get_cancelable_runs(
+    repo: str, status: str, wanted_names: set[str] | None = None
+) -> list[CancelableRun]:
+    """Get workflow runs that can be canceled with additional fields.
 
-
-def get_cancelable_runs(repo: str, status: str) -> list[dict[str, Any]]:
-    """Get workflow runs that can be canceled with additional fields."""
+    If wanted_names is given, only runs of workflows with those display
+    names are returned.
+    """
     runs = get_workflow_runs(repo, status)
     # Extract only the fields we need
     return [
-        {"id": run.get("id"), "name": run.get("name"), "run_number": run.get("run_number")}
+        CancelableRun(run["id"], run.get("name", ""), run["run_number"])
         for run in runs
+        if wanted_names is None or run.get("name", "") in wanted_names
     ]
 
 
@@ -77,7 +98,7 @@ def cancel_run(repo: str, run_id: int) -> bool:
     )
     if result.returncode != 0:
         # Run may have already completed - this is not an error
-        if "cannot be cancelled" in result.stderr.lower():
+        if _ALREADY_DONE_RE.search(result.stderr):
             return True
         print(f"Failed to cancel run {run_id}: {result.stderr.strip()}",
               file=sys.stderr)
@@ -85,6 +106,16 @@ def cancel_run(repo: str, run_id: int) -> bool:
     return True
 
 
+def cancel_runs(repo: str, run_ids: list[int]) -> list[bool]:
+    """Cancel workflow runs concurrently. Returns per-run success in order."""
+    if not run_ids:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_CANCEL_WORKERS, len(run_ids))
+    ) as executor:
+        return list(executor.map(lambda run_id: cancel_run(repo, run_id), run_ids))
+
+
 def main() -> int:
     """Main entry point."""
     args = parse_args()
@@ -114,23 +145,22 @@ def main() -> int:
     # Build name-to-key mapping
     name_to_key = build_name_to_key_map(graph)
 
-    # Get cancelable runs and filter to ones that should be canceled
-    runs_to_cancel: list[dict[str, Any]] = [
-        run for run in (get_cancelable_runs(args.repo, "in_progress") +
-                        get_cancelable_runs(args.repo, "queued"))
-        if name_to_key.get(run.get("name", "")) in workflows_to_cancel
-    ]
+    # Get cancelable runs of only the workflows that should be canceled
+    wanted_names = {
+        name for name, key in name_to_key.items() if key in workflows_to_cancel
+    }
+    runs_to_cancel = (
+        get_cancelable_runs(args.repo, "in_progress", wanted_names) +
+        get_cancelable_runs(args.repo, "queued", wanted_names)
+    )
 
     if not runs_to_cancel:
         return 0
 
     # Cancel runs
-    failed = 0
-    for run in runs_to_cancel:
-        if not cancel_run(args.repo, run["id"]):
-            failed += 1
+    results = cancel_runs(args.repo, [run.id for run in runs_to_cancel])
 
-    return 1 if failed > 0 else 0
+    return 0 if all(results) else 1
 
 
 if __name__ == "__main__":
@@ -26,7 +26,7 @@ import sys
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from utils import create_base_parser, load_dependency_graph
+from utils import create_base_parser, get_dependencies, load_dependency_graph
 
 
 def parse_args() -> argparse.Namespace:
@@ -52,7 +52,7 @@ def find_descendants(graph: dict[str, Any], workflow: str) -> list[str]:
     """Find all workflows that directly depend on the specified workflow."""
     return [
         name for name, config in graph.items()
-        if workflow in config.get("depends_on", [])
+        if workflow in config.get("depends_on", ())
     ]
 
 
@@ -92,7 +92,7 @@ def get_dependency_status(
         - satisfied: list[str] - dependencies that have been met
         - missing: list[str] - dependencies that are still missing
     """
-    dependencies = graph.get(descendant, {}).get("depends_on", [])
+    dependencies = get_dependencies(graph, descendant)
     other_deps = [d for d in dependencies if d != current_workflow]
 
     # Current workflow is always satisfied (it just completed)
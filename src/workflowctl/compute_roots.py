@@ -20,18 +20,33 @@ Output:
 """
 
 import argparse
+import bisect
+import functools
 import json
+import re
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, NamedTuple
 
-from utils import file_matches_pattern, get_all_descendants
+from utils import (
+    collect_transitive,
+    collect_with_descendants,
+    compile_patterns,
+    get_dependencies,
+    load_dependency_graph,
+)
 
+_GLOB_CHARS = frozenset("*?[")
 
-def load_dependency_graph(graph_path: Path) -> dict[str, Any]:
-    """Load the workflow dependency graph from JSON file."""
-    with open(graph_path, encoding="utf-8") as file:
-        return json.load(file)
+
+class _PathIndex(NamedTuple):
+    """Path patterns of several keys, grouped by how they can be matched."""
+
+    exact: dict[str, set[str]]
+    dirs: dict[str, set[str]]
+    globs: dict[str, re.Pattern[str]]
+    any_glob: re.Pattern[str] | None
+    top_levels: frozenset[str]
 
 
 def load_and_validate_graph(graph_arg: str) -> dict[str, Any]:
@@ -71,39 +86,33 @@ def get_all_ancestors(
     if cache is None:
         cache = {}
 
-    if workflow in cache:
-        return cache[workflow]
-
-    ancestors: set[str] = set()
-    direct_deps = graph.get(workflow, {}).get("depends_on", [])
-
-    for dep in direct_deps:
-        ancestors.add(dep)
-        ancestors.update(get_all_ancestors(dep, graph, cache))
-
-    cache[workflow] = ancestors
-    return ancestors
+    return collect_transitive(
+        workflow, functools.partial(get_dependencies, graph), cache
+    )
 
 
 def insert_sorted(queue: list[str], item: str) -> None:
     """Insert an item into a sorted list maintaining sort order."""
-    for i, existing in enumerate(queue):
-        if item < existing:
-            queue.insert(i, item)
-            return
-    queue.append(item)
+    bisect.insort_right(queue, item)
 
 
-def _build_in_degree_map(
+def _build_dependency_maps(
     workflows: set[str], graph: dict[str, Any]
-) -> dict[str, int]:
-    """Build in-degree map counting dependencies within the workflow set."""
+) -> tuple[dict[str, int], dict[str, list[str]]]:
+    """
+    Build in-degree and dependents maps restricted to the workflow set.
+
+    Returns (in_degree, children): the number of dependencies each workflow
+    has within the set, and the workflows in the set that depend on each one.
+    """
     in_degree: dict[str, int] = {wf: 0 for wf in workflows}
+    children: dict[str, list[str]] = {wf: [] for wf in workflows}
     for wf in workflows:
-        for dep in graph.get(wf, {}).get("depends_on", []):
+        for dep in get_dependencies(graph, wf):
             if dep in workflows:
                 in_degree[wf] += 1
-    return in_degree
+                children[dep].append(wf)
+    return in_degree, children
 
 
 def topological_sort(workflows: set[str], graph: dict[str, Any]) -> list[str]:
@@ -113,7 +122,7 @@ def topological_sort(workflows: set[str], graph: dict[str, Any]) -> list[str]:
     Uses Kahn's algorithm to ensure workflows are ordered such that
     all dependencies come before their dependents.
     """
-    in_degree = _build_in_degree_map(workflows, graph)
+    in_degree, children = _build_dependency_maps(workflows, graph)
     queue = sorted([wf for wf, degree in in_degree.items() if degree == 0])
     result: list[str] = []
 
@@ -121,12 +130,11 @@ def topological_sort(workflows: set[str], graph: dict[str, Any]) -> list[str]:
         current = queue.pop(0)
         result.append(current)
 
-        # Find workflows that depend on current and add ready ones to queue
-        for wf in workflows:
-            if current in graph.get(wf, {}).get("depends_on", []):
-                in_degree[wf] -= 1
-                if in_degree[wf] == 0:
-                    insert_sorted(queue, wf)
+        # Add dependents of current that have no remaining dependencies
+        for wf in children[current]:
+            in_degree[wf] -= 1
+            if in_degree[wf] == 0:
+                insert_sorted(queue, wf)
 
     return result
 
@@ -146,31 +154,24 @@ def topological_sort_levels(
     Returns a list of levels, where each level contains workflows that
     can run in parallel (all their dependencies are in earlier levels).
     Workflows within each level are sorted by display_order, then alphabetically.
+    Workflows on a dependency cycle are left out.
     """
-    in_degree = _build_in_degree_map(workflows, graph)
+    in_degree, children = _build_dependency_maps(workflows, graph)
     levels: list[list[str]] = []
-    remaining = set(workflows)
+    frontier = [wf for wf, degree in in_degree.items() if degree == 0]
 
-    while remaining:
-        # Find all workflows with no remaining dependencies
+    while frontier:
         # Sort by display_order first, then alphabetically
-        current_level = sorted(
-            [wf for wf in remaining if in_degree[wf] == 0],
-            key=lambda wf: _sort_key(wf, graph)
-        )
-
-        if not current_level:
-            # Cycle detected or error
-            break
-
+        current_level = sorted(frontier, key=lambda wf: _sort_key(wf, graph))
         levels.append(current_level)
 
-        # Remove current level from remaining and update in-degrees
+        # The next level is every dependent whose last dependency just ran
+        frontier = []
         for wf in current_level:
-            remaining.remove(wf)
-            for other in remaining:
-                if wf in graph.get(other, {}).get("depends_on", []):
-                    in_degree[other] -= 1
+            for child in children[wf]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    frontier.append(child)
 
     return levels
 
@@ -182,15 +183,7 @@ def compute_execution_plan(roots: list[str], graph: dict[str, Any]) -> list[str]
     Returns all workflows that need to run (roots + all descendants)
     in topological order.
     """
-    # Collect all workflows to run (roots + their descendants)
-    all_workflows: set[str] = set(roots)
-    descendant_cache: dict[str, set[str]] = {}
-
-    for root in roots:
-        all_workflows.update(get_all_descendants(root, graph, descendant_cache))
-
-    # Sort in topological order
-    return topological_sort(all_workflows, graph)
+    return topological_sort(collect_with_descendants(roots, graph), graph)
 
 
 def compute_execution_plan_levels(
@@ -202,20 +195,80 @@ def compute_execution_plan_levels(
     Returns levels of workflows where each level can run in parallel,
     and all levels must complete before the next level starts.
     """
-    # Collect all workflows to run (roots + their descendants)
-    all_workflows: set[str] = set(roots)
-    descendant_cache: dict[str, set[str]] = {}
+    return topological_sort_levels(
+        collect_with_descendants(roots, graph), graph
+    )
+
+
+def _pattern_kind(pattern: str) -> str:
+    """
+    Classify a path pattern by how it can be matched.
+
+    Returns "exact" for patterns without glob characters, which match only
+    that path, "dir" for "dir/**" with a literal dir, which matches every
+    path under dir/, and "glob" for anything else.
+    """
+    if not _GLOB_CHARS.intersection(pattern):
+        return "exact"
+    if pattern.endswith("/**") and not _GLOB_CHARS.intersection(pattern[:-2]):
+        return "dir"
+    return "glob"
+
+
+def _index_path_patterns(patterns_by_key: dict[str, Iterable[str]]) -> _PathIndex:
+    """
+    Index the path patterns of each key for matching many files.
+
+    Exact paths and dir/ prefixes are found with dict lookups. Globs are
+    compiled into one regex per key, plus one regex over all globs that
+    rejects files matching none of them in a single scan.
+    """
+    exact: dict[str, set[str]] = {}
+    dirs: dict[str, set[str]] = {}
+    globs: dict[str, list[str]] = {}
+
+    for key, patterns in patterns_by_key.items():
+        for pattern in patterns:
+            kind = _pattern_kind(pattern)
+            if kind == "exact":
+                exact.setdefault(pattern, set()).add(key)
+            elif kind == "dir":
+                dirs.setdefault(pattern[:-2], set()).add(key)
+            else:
+                globs.setdefault(key, []).append(pattern)
+
+    all_globs = tuple(p for patterns in globs.values() for p in patterns)
+    return _PathIndex(
+        exact=exact,
+        dirs=dirs,
+        globs={key: compile_patterns(tuple(ps)) for key, ps in globs.items()},
+        any_glob=compile_patterns(all_globs) if all_globs else None,
+        # Files outside every top-level directory named by an exact or dir
+        # pattern can only match a glob
+        top_levels=frozenset(p.split("/", 1)[0] for p in (*exact, *dirs)),
+    )
 
-    for root in roots:
-        all_workflows.update(get_all_descendants(root, graph, descendant_cache))
 
-    # Sort into levels
-    return topological_sort_levels(all_workflows, graph)
+def _match_path(index: _PathIndex, filepath: str) -> set[str]:
+    """Return the keys of the index with a pattern matching the file path."""
+    matched: set[str] = set()
+    if filepath.split("/", 1)[0] in index.top_levels:
+        matched.update(index.exact.get(filepath, ()))
+        # Look up every enclosing directory of the file
+        slash = filepath.find("/")
+        while slash != -1:
+            matched.update(index.dirs.get(filepath[:slash + 1], ()))
+            slash = filepath.find("/", slash + 1)
+    if index.any_glob is not None and index.any_glob.match(filepath):
+        matched.update(
+            key for key, matcher in index.globs.items() if matcher.match(filepath)
+        )
+    return matched
 
 
 def file_matches_patterns(filepath: str, patterns: list[str]) -> bool:
     """Check if a file path matches any of the given glob patterns."""
-    return any(file_matches_pattern(filepath, pattern) for pattern in patterns)
+    return bool(_match_path(_index_path_patterns({"": patterns}), filepath))
 
 
 def get_affected_workflows(
@@ -226,20 +279,35 @@ def get_affected_workflows(
 
     Returns a set of workflow keys whose path patterns match any changed file.
     """
+    index = _index_path_patterns({
+        workflow_key: workflow_config.get("paths", ())
+        for workflow_key, workflow_config in graph.items()
+    })
     affected: set[str] = set()
+    for filepath in changed_files:
+        affected |= _match_path(index, filepath)
+    return affected
 
-    for workflow_key, workflow_config in graph.items():
-        patterns = workflow_config.get("paths", [])
-        for filepath in changed_files:
-            if file_matches_patterns(filepath, patterns):
-                affected.add(workflow_key)
-                break
 
-    return affected
+def _find_roots(
+    affected: set[str],
+    graph: dict[str, Any],
+    ancestor_cache: dict[str, set[str]] | None
+) -> list[str]:
+    """Return the affected workflows that have no affected ancestors, sorted."""
+    if ancestor_cache is None:
+        ancestor_cache = {}
+    # Sort for deterministic output
+    return sorted(
+        workflow for workflow in affected
+        if get_all_ancestors(workflow, graph, ancestor_cache).isdisjoint(affected)
+    )
 
 
 def compute_root_workflows(
-    changed_files: list[str], graph: dict[str, Any]
+    changed_files: list[str],
+    graph: dict[str, Any],
+    ancestor_cache: dict[str, set[str]] | None = None
 ) -> list[str]:
     """
     Compute the root workflows to trigger.
@@ -250,33 +318,22 @@ def compute_root_workflows(
 
     Root workflows should be triggered directly. Their descendants will be
     triggered via workflow_run cascading when the roots complete.
+    Pass the same ancestor_cache to later calls on this graph to reuse
+    the ancestor sets computed here.
     """
     affected = get_affected_workflows(changed_files, graph)
 
     if not affected:
         return []
 
-    # Build ancestor cache
-    ancestor_cache: dict[str, set[str]] = {}
-    for workflow in affected:
-        get_all_ancestors(workflow, graph, ancestor_cache)
-
-    # Find roots: affected workflows with no affected ancestors
-    roots: list[str] = []
-    for workflow in affected:
-        ancestors = ancestor_cache.get(workflow, set())
-        # If none of this workflow's ancestors are affected, it's a root
-        if not ancestors.intersection(affected):
-            roots.append(workflow)
-
-    # Sort for deterministic output
-    return sorted(roots)
+    return _find_roots(affected, graph, ancestor_cache)
 
 
 def compute_merge_roots(
     running_workflows: list[str],
     new_roots: list[str],
-    graph: dict[str, Any]
+    graph: dict[str, Any],
+    ancestor_cache: dict[str, set[str]] | None = None
 ) -> list[str]:
     """
     Compute the minimal set of root workflows that covers both
@@ -300,21 +357,7 @@ def compute_merge_roots(
     if not affected:
         return []
 
-    # Build ancestor cache
-    ancestor_cache: dict[str, set[str]] = {}
-    for workflow in affected:
-        get_all_ancestors(workflow, graph, ancestor_cache)
-
-    # Find merge roots: workflows with no affected ancestors
-    roots: list[str] = []
-    for workflow in affected:
-        ancestors = ancestor_cache.get(workflow, set())
-        # If none of this workflow's ancestors are in affected set, it's a root
-        if not ancestors.intersection(affected):
-            roots.append(workflow)
-
-    # Sort for deterministic output
-    return sorted(roots)
+    return _find_roots(affected, graph, ancestor_cache)
 
 
 def _parse_args() -> argparse.Namespace:
@@ -366,10 +409,11 @@ def _parse_args() -> argparse.Namespace:
 
 def output_slots(output: list[str], num_slots: int) -> None:
     """Output slot variables for GitHub Actions."""
-    print(f"count={len(output)}")
+    lines = [f"count={len(output)}"]
     for i in range(1, num_slots + 1):
         key = output[i - 1] if i <= len(output) else ""
-        print(f"key_{i:02d}={key}")
+        lines.append(f"key_{i:02d}={key}")
+    print("\n".join(lines))
 
 
 def output_results(output: list[str], indexed: bool = False) -> None:
@@ -386,16 +430,15 @@ def output_results(output: list[str], indexed: bool = False) -> None:
 
 def output_levels_indexed(levels: list[list[str]]) -> None:
     """Output levels as indexed objects for GitHub Actions matrix visualization."""
-    indexed_output = []
-    idx = 1
-    for level_num, level_workflows in enumerate(levels, 1):
-        for name in level_workflows:
-            indexed_output.append({
-                "idx": f"{idx:02d}",
-                "level": level_num,
-                "name": name
-            })
-            idx += 1
+    leveled = (
+        (level_num, name)
+        for level_num, level_workflows in enumerate(levels, 1)
+        for name in level_workflows
+    )
+    indexed_output = [
+        {"idx": f"{idx:02d}", "level": level_num, "name": name}
+        for idx, (level_num, name) in enumerate(leveled, 1)
+    ]
     print(json.dumps({"workflows": indexed_output}))
 
 
@@ -411,6 +454,9 @@ def main() -> None:
     # Load dependency graph
     graph = load_and_validate_graph(args.graph)
 
+    # Ancestor sets are shared between root and merge-root computation
+    ancestor_cache: dict[str, set[str]] = {}
+
     # Determine roots: either from --start-from or from changed files
     if args.start_from:
         if args.start_from not in graph:
@@ -422,13 +468,15 @@ def main() -> None:
             sys.exit(1)
         roots = [args.start_from]
     else:
-        roots = compute_root_workflows(changed_files, graph)
+        roots = compute_root_workflows(changed_files, graph, ancestor_cache)
 
     # Merge with running workflows if provided
     if args.running:
         running_workflows = json.loads(args.running)
         if running_workflows:
-            roots = compute_merge_roots(running_workflows, roots, graph)
+            roots = compute_merge_roots(
+                running_workflows, roots, graph, ancestor_cache
+            )
 
     # Compute execution plan if requested
     if args.levels:
@@ -34,6 +34,9 @@ from utils import (
     workflow_file_exists,
 )
 
+_TRIGGER_DESCENDANTS_RE = re.compile(r"\[trigger descendants\]", re.IGNORECASE)
+_INVALIDATE_CLOUDFRONT_RE = re.compile(r"\[invalidate cloudfront\]", re.IGNORECASE)
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -80,13 +83,10 @@ def should_trigger_descendants(
     1. trigger_flag is True (--trigger-descendants passed), OR
     2. Commit message contains [trigger descendants]
     """
-    if trigger_flag:
-        return True
-
-    if re.search(r"\[trigger descendants\]", commit_message, re.IGNORECASE):
-        return True
-
-    return False
+    return (
+        trigger_flag
+        or _TRIGGER_DESCENDANTS_RE.search(commit_message) is not None
+    )
 
 
 def should_invalidate_cloudfront(
@@ -99,13 +99,10 @@ def should_invalidate_cloudfront(
     1. invalidate_flag is True (--invalidate-cloudfront passed), OR
     2. Commit message contains [invalidate cloudfront]
     """
-    if invalidate_flag:
-        return True
-
-    if re.search(r"\[invalidate cloudfront\]", commit_message, re.IGNORECASE):
-        return True
-
-    return False
+    return (
+        invalidate_flag
+        or _INVALIDATE_CLOUDFRONT_RE.search(commit_message) is not None
+    )
 
 
 def dispatch_workflow(
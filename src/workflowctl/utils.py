@@ -6,11 +6,14 @@ to avoid code duplication.
 """
 import argparse
 import fnmatch
+import functools
 import json
 import os
+import re
 import subprocess
 import sys
-from typing import Any
+from collections import deque
+from typing import Any, Callable, Sequence
 
 
 def create_base_parser(description: str) -> argparse.ArgumentParser:
@@ -85,10 +88,18 @@ def load_graph_with_error(graph_path: str) -> tuple[dict[str, Any] | None, str]:
         return None, f"Error: Graph file not found: {graph_path}"
 
 
-def load_dependency_graph(graph_path: str) -> dict[str, Any]:
-    """Load the workflow dependency graph from JSON file."""
+def load_dependency_graph(graph_path: str | os.PathLike[str]) -> dict[str, Any]:
+    """Load the workflow dependency graph from JSON file.
+
+    Workflow keys and depends_on entries are interned so the set and dict
+    operations over them can match by identity.
+    """
     with open(graph_path, encoding="utf-8") as f:
-        return json.load(f)
+        graph = json.load(f)
+    for config in graph.values():
+        if "depends_on" in config:
+            config["depends_on"] = [sys.intern(dep) for dep in config["depends_on"]]
+    return {sys.intern(key): config for key, config in graph.items()}
 
 
 def build_name_to_key_map(graph: dict[str, Any]) -> dict[str, str]:
@@ -105,13 +116,64 @@ def build_name_to_key_map(graph: dict[str, Any]) -> dict[str, str]:
     return name_to_key
 
 
+def get_dependencies(graph: dict[str, Any], workflow: str) -> Sequence[str]:
+    """Return the direct dependencies of a workflow, or () if it has none."""
+    config = graph.get(workflow)
+    return config.get("depends_on", ()) if config else ()
+
+
+def build_children_map(graph: dict[str, Any]) -> dict[str, list[str]]:
+    """Invert depends_on into a mapping from each workflow to its dependents."""
+    children: dict[str, list[str]] = {key: [] for key in graph}
+    for key, config in graph.items():
+        for dep in config.get("depends_on", ()):
+            children.setdefault(dep, []).append(key)
+    return children
+
+
+def collect_transitive(
+    workflow: str,
+    neighbors: Callable[[str], Sequence[str]],
+    cache: dict[str, set[str]],
+) -> set[str]:
+    """Get every workflow reachable from a workflow through neighbors.
+
+    Results for every workflow visited along the way are stored in cache.
+    """
+    # Iterative post-order DFS: a workflow's result is its neighbors
+    # plus the already-computed results of each neighbor.
+    in_progress: set[str] = set()
+    stack: list[tuple[str, bool]] = [(workflow, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if node in cache:
+            continue
+        node_neighbors = neighbors(node)
+        if expanded:
+            reachable = set(node_neighbors)
+            for neighbor in node_neighbors:
+                if neighbor in cache:
+                    reachable |= cache[neighbor]
+            cache[node] = reachable
+        elif node not in in_progress:
+            in_progress.add(node)
+            stack.append((node, True))
+            stack.extend(
+                (neighbor, False) for neighbor in node_neighbors
+                if neighbor not in cache and neighbor not in in_progress
+            )
+
+    return cache[workflow]
+
+
 def get_all_descendants(
     workflow: str, graph: dict[str, Any], cache: dict[str, set[str]] | None = None
 ) -> set[str]:
     """Get all descendants (workflows that depend on this one) of a workflow.
 
     Returns a set of workflow keys that depend on this workflow,
-    including indirect dependents.
+    including indirect dependents. Descendant sets of every workflow
+    visited along the way are stored in cache.
     """
     if cache is None:
         cache = {}
@@ -119,16 +181,24 @@ def get_all_descendants(
     if workflow in cache:
         return cache[workflow]
 
-    descendants: set[str] = set()
+    children = build_children_map(graph)
+    return collect_transitive(workflow, lambda node: children.get(node, ()), cache)
 
-    # Find all workflows that directly depend on this one
-    for wf_key, wf_config in graph.items():
-        if workflow in wf_config.get("depends_on", []):
-            descendants.add(wf_key)
-            descendants.update(get_all_descendants(wf_key, graph, cache))
 
-    cache[workflow] = descendants
-    return descendants
+def collect_with_descendants(roots: list[str], graph: dict[str, Any]) -> set[str]:
+    """Get the given root workflows together with all of their descendants."""
+    children = build_children_map(graph)
+    collected: set[str] = set(roots)
+    # Single BFS seeded with every root so shared subgraphs are walked once
+    queue = deque(roots)
+
+    while queue:
+        for child in children.get(queue.popleft(), ()):
+            if child not in collected:
+                collected.add(child)
+                queue.append(child)
+
+    return collected
 
 
 def get_workflow_runs(repo: str, status: str) -> list[dict[str, Any]]:
@@ -144,7 +214,7 @@ def get_workflow_runs(repo: str, status: str) -> list[dict[str, Any]]:
     result = subprocess.run(
         [
             "gh", "api",
-            f"repos/{repo}/actions/runs",
+            f"repos/{repo}/actions/runs?status={status}",
             "-q", f".workflow_runs | map(select(.status == \"{status}\"))"
         ],
         capture_output=True,
@@ -160,19 +230,30 @@ def get_workflow_runs(repo: str, status: str) -> list[dict[str, Any]]:
         return []
 
 
+def pattern_regex(pattern: str) -> str:
+    """Translate a workflow path pattern into regex source for re.match.
+
+    A pattern containing ** also matches every path under the directory
+    prefix before its first **.
+    """
+    regex = fnmatch.translate(pattern)
+    if "**" in pattern:
+        regex = f"{re.escape(pattern.split('**')[0])}|{regex}"
+    return regex
+
+
+@functools.lru_cache(maxsize=256)
+def compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile one regex matching any of the given path patterns, once per process."""
+    return re.compile("|".join(f"(?:{pattern_regex(p)})" for p in patterns))
+
+
 def file_matches_pattern(filepath: str, pattern: str) -> bool:
     """Check if a file path matches a glob pattern.
 
     Supports ** for recursive directory matching.
     """
-    if "**" in pattern:
-        base_pattern = pattern.replace("**", "*")
-        if fnmatch.fnmatch(filepath, base_pattern):
-            return True
-        dir_prefix = pattern.split("**")[0]
-        if filepath.startswith(dir_prefix):
-            return True
-    return fnmatch.fnmatch(filepath, pattern)
+    return compile_patterns((pattern,)).match(filepath) is not None
 
 
 def run_subprocess(cmd: list[str]) -> subprocess.CompletedProcess[str]:
@@ -205,18 +286,47 @@ def dispatch_gh_workflow(
     return True
 
 
+@functools.lru_cache(maxsize=8)
+def list_workflow_files(workflows_dir: str) -> frozenset[str]:
+    """List workflows that have a .yml file, scanning each directory once.
+
+    Raises OSError if the directory cannot be scanned, so a failed scan is
+    not cached and the next call scans again.
+    """
+    with os.scandir(workflows_dir) as entries:
+        return frozenset(
+            entry.name[:-len(".yml")] for entry in entries
+            if entry.name.endswith(".yml") and entry.is_file()
+        )
+
+
 def workflow_file_exists(workflow: str) -> bool:
     """Check if the workflow file exists."""
-    workflow_file = f".github/workflows/{workflow}.yml"
-    return os.path.isfile(workflow_file)
+    # Key the cache on the absolute directory so a change of working
+    # directory scans the new one
+    try:
+        return workflow in list_workflow_files(os.path.abspath(".github/workflows"))
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def read_workflow_file(workflow_file: str) -> str:
+    """Read a workflow file once per process.
+
+    Raises OSError if the file cannot be read, so a failed read is not
+    cached and the next call reads again.
+    """
+    with open(workflow_file, encoding="utf-8") as f:
+        return f.read()
 
 
 def workflow_accepts_input(workflow: str, input_name: str) -> bool:
     """Check if a workflow accepts a specific input."""
-    workflow_file = f".github/workflows/{workflow}.yml"
+    # Key the cache on the absolute path so a change of working directory
+    # reads the new file
+    workflow_file = os.path.abspath(f".github/workflows/{workflow}.yml")
     try:
-        with open(workflow_file, encoding="utf-8") as f:
-            content = f.read()
-            return f"{input_name}:" in content
-    except (OSError, IOError):
+        return f"{input_name}:" in read_workflow_file(workflow_file)
+    except OSError:
         return False
@@ -6,7 +6,7 @@ from repo_utils import REPO_ROOT
 
 pytest_plugins = ['test_fixtures.aws']
 
-BOOTSTRAP_DIR = REPO_ROOT / "src" / "bootstrap"
+BOOTSTRAP_DIR = (REPO_ROOT / "src" / "bootstrap").resolve()
 LOCALS_TF_PATH = BOOTSTRAP_DIR / "locals.tf"
 
 
@@ -34,7 +34,7 @@ def _get_locals_derived_values(shared: dict) -> dict:
     }
 
 
-@pytest.fixture(scope="module", name='bootstrap_dir')
+@pytest.fixture(scope="session", name='bootstrap_dir')
 def bootstrap_dir_fixture():
     """Provide path to bootstrap directory."""
     return BOOTSTRAP_DIR
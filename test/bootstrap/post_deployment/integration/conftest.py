@@ -1,6 +1,11 @@
 """Fixtures for bootstrap post-deployment integration tests."""
+import json
+import re
+
 import pytest
 
+_LOG_GROUP_RE = re.compile(r':log-group:([^:]+)')
+
 
 @pytest.fixture(scope="module", name="cloudtrail_trail")
 def cloudtrail_trail_fixture(cloudtrail_client):
@@ -13,4 +18,20 @@ def cloudtrail_trail_fixture(cloudtrail_client):
 def cloudtrail_log_group_name_fixture(cloudtrail_trail):
     """Get the CloudTrail log group name."""
     log_group_arn = cloudtrail_trail['CloudWatchLogsLogGroupArn']
-    return log_group_arn.split(':log-group:')[1].split(':')[0]
+    return _LOG_GROUP_RE.search(log_group_arn).group(1)
+
+
+@pytest.fixture(scope="module", name="oidc_provider")
+def oidc_provider_fixture(iam_client, config):
+    """Get the GitHub Actions OIDC provider."""
+    account_id = config['aws_account_id']
+    provider_arn = f"arn:aws:iam::{account_id}:oidc-provider/token.actions.githubusercontent.com"
+    return iam_client.get_open_id_connect_provider(OpenIDConnectProviderArn=provider_arn)
+
+
+@pytest.fixture(scope="module", name="state_bucket_policy_doc")
+def state_bucket_policy_doc_fixture(s3_client, config):
+    """Get the parsed OpenTofu state bucket policy document."""
+    bucket_name = config['name_for_opentofu_state_bucket']
+    policy = s3_client.get_bucket_policy(Bucket=bucket_name)
+    return json.loads(policy['Policy'])
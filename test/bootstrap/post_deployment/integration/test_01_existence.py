@@ -100,9 +100,6 @@ def test_iam_role_exists_in_aws(iam_client, config):
 # =============================================================================
 
 
-def test_oidc_provider_exists_in_aws(iam_client, config):
+def test_oidc_provider_exists_in_aws(oidc_provider):
     """Test that OIDC provider exists in AWS."""
-    account_id = config['aws_account_id']
-    provider_arn = f"arn:aws:iam::{account_id}:oidc-provider/token.actions.githubusercontent.com"
-    response = iam_client.get_open_id_connect_provider(OpenIDConnectProviderArn=provider_arn)
-    assert response['Url'] == 'token.actions.githubusercontent.com'
+    assert oidc_provider['Url'] == 'token.actions.githubusercontent.com'
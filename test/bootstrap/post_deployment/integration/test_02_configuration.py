@@ -447,21 +447,15 @@ def test_cloudtrail_iam_role_name_is_pascalcase(config):
 # =============================================================================
 
 
-def test_oidc_provider_has_correct_thumbprint(iam_client, config):
+def test_oidc_provider_has_correct_thumbprint(oidc_provider):
     """Test that OIDC provider has correct thumbprint."""
-    account_id = config['aws_account_id']
-    provider_arn = f"arn:aws:iam::{account_id}:oidc-provider/token.actions.githubusercontent.com"
-    response = iam_client.get_open_id_connect_provider(OpenIDConnectProviderArn=provider_arn)
-    thumbprint = response['ThumbprintList'][0]
+    thumbprint = oidc_provider['ThumbprintList'][0]
     assert thumbprint == '6938fd4d98bab03faadb97b34396831e3780aea1'
 
 
-def test_oidc_provider_has_correct_client_id(iam_client, config):
+def test_oidc_provider_has_correct_client_id(oidc_provider):
     """Test that OIDC provider has correct client ID."""
-    account_id = config['aws_account_id']
-    provider_arn = f"arn:aws:iam::{account_id}:oidc-provider/token.actions.githubusercontent.com"
-    response = iam_client.get_open_id_connect_provider(OpenIDConnectProviderArn=provider_arn)
-    client_id = response['ClientIDList'][0]
+    client_id = oidc_provider['ClientIDList'][0]
     assert client_id == 'sts.amazonaws.com'
 
 
@@ -525,12 +519,14 @@ def test_opentofu_state_bucket_has_policy(s3_client, config):
     assert 'Policy' in policy
 
 
-def test_opentofu_state_bucket_policy_denies_insecure_transport(s3_client, config):
+def test_opentofu_state_bucket_policy_denies_insecure_transport(state_bucket_policy_doc):
     """Test that OpenTofu state bucket policy denies insecure transport."""
-    bucket_name = config['name_for_opentofu_state_bucket']
-    policy = s3_client.get_bucket_policy(Bucket=bucket_name)
-    policy_doc = policy['Policy']
-    assert 'aws:SecureTransport' in policy_doc
+    denies_insecure = [
+        statement for statement in state_bucket_policy_doc['Statement']
+        if statement['Effect'] == 'Deny'
+        and statement.get('Condition', {}).get('Bool', {}).get('aws:SecureTransport') == 'false'
+    ]
+    assert denies_insecure
 
 
 def test_opentofu_state_bucket_has_logging_enabled(s3_client, config):
@@ -5,6 +5,24 @@ Tests assume Layer 1 existence and Layer 2 configuration tests have passed.
 """
 
 
+def _extract_principals(statements, principal_type):
+    """Collect principals of the given type from policy statements.
+
+    Statements whose Principal is a bare string such as "*" name no
+    principal of any specific type and are skipped.
+    """
+    principals = []
+    for statement in statements:
+        principal_block = statement.get('Principal', {})
+        if not isinstance(principal_block, dict):
+            continue
+        principal = principal_block.get(principal_type, [])
+        if isinstance(principal, list):
+            principals.extend(principal)
+        else:
+            principals.append(principal)
+    return principals
+
 
 # =============================================================================
 # CloudTrail Wiring
@@ -16,19 +34,15 @@ def test_cloudtrail_writes_logs_to_s3(s3_client, cloudtrail_client):
     trails = cloudtrail_client.describe_trails()
     trail = trails['trailList'][0]
     bucket_name = trail['S3BucketName']
-    objects = s3_client.list_objects_v2(Bucket=bucket_name, MaxKeys=10)
+    objects = s3_client.list_objects_v2(Bucket=bucket_name, MaxKeys=1)
     key_count = objects['KeyCount']
     assert key_count > 0
 
 
-def test_cloudtrail_writes_logs_to_cloudwatch(logs_client, cloudtrail_client):
+def test_cloudtrail_writes_logs_to_cloudwatch(logs_client, cloudtrail_log_group_name):
     """Test that CloudTrail writes logs to CloudWatch."""
-    trails = cloudtrail_client.describe_trails()
-    trail = trails['trailList'][0]
-    log_group_arn = trail['CloudWatchLogsLogGroupArn']
-    log_group_name = log_group_arn.split(':log-group:')[1].split(':')[0]
     streams = logs_client.describe_log_streams(
-        logGroupName=log_group_name,
+        logGroupName=cloudtrail_log_group_name,
         orderBy='LastEventTime',
         descending=True,
         limit=1
@@ -62,14 +76,7 @@ def test_cloudtrail_iam_role_trust_policy_allows_cloudtrail(iam_client, cloudtra
         role_name = trail['CloudWatchLogsRoleArn'].split('/')[-1]
         response = iam_client.get_role(RoleName=role_name)
         trust_policy = response['Role']['AssumeRolePolicyDocument']
-        principals = []
-        for statement in trust_policy['Statement']:
-            principal = statement.get('Principal', {})
-            if 'Service' in principal:
-                if isinstance(principal['Service'], list):
-                    principals.extend(principal['Service'])
-                else:
-                    principals.append(principal['Service'])
+        principals = _extract_principals(trust_policy['Statement'], 'Service')
         assert 'cloudtrail.amazonaws.com' in principals
 
 
@@ -101,13 +108,17 @@ def test_cloudtrail_iam_role_policy_allows_log_actions(iam_client, cloudtrail_cl
 # =============================================================================
 
 
-def test_opentofu_state_bucket_policy_allows_github_actions_role(s3_client, config):
+def test_opentofu_state_bucket_policy_allows_github_actions_role(
+    state_bucket_policy_doc, config
+):
     """Test that OpenTofu state bucket policy allows GitHub Actions role."""
-    bucket_name = config['name_for_opentofu_state_bucket']
-    policy = s3_client.get_bucket_policy(Bucket=bucket_name)
-    policy_doc = policy['Policy']
+    allow_statements = [
+        statement for statement in state_bucket_policy_doc['Statement']
+        if statement['Effect'] == 'Allow'
+    ]
+    principals = _extract_principals(allow_statements, 'AWS')
     role_name = config['name_for_github_actions_role']
-    assert role_name in policy_doc
+    assert any(principal.endswith(f":role/{role_name}") for principal in principals)
 
 
 # =============================================================================
@@ -121,5 +132,5 @@ def test_github_actions_role_is_attached_to_oidc_provider(iam_client, config):
     response = iam_client.get_role(RoleName=role_name)
     trust_policy = response['Role']['AssumeRolePolicyDocument']
     oidc_provider = 'token.actions.githubusercontent.com'
-    trust_doc = str(trust_policy)
-    assert oidc_provider in trust_doc
+    principals = _extract_principals(trust_policy['Statement'], 'Federated')
+    assert any(oidc_provider in principal for principal in principals)
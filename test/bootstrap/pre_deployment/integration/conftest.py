@@ -26,16 +26,16 @@ def _extract_output_names(outputs_content: str) -> set:
     return set(re.findall(pattern, outputs_content))
 
 
-@pytest.fixture(name="bootstrap_dir")
+@pytest.fixture(scope="session", name="bootstrap_dir")
 def bootstrap_dir_fixture() -> Path:
     """Get the bootstrap source directory."""
-    return REPO_ROOT / "src" / "bootstrap"
+    return (REPO_ROOT / "src" / "bootstrap").resolve()
 
 
-@pytest.fixture(name="common_module_dir")
+@pytest.fixture(scope="session", name="common_module_dir")
 def common_module_dir_fixture() -> Path:
     """Get the common module directory."""
-    return REPO_ROOT / "lib" / "opentofu" / "common"
+    return (REPO_ROOT / "lib" / "opentofu" / "common").resolve()
 
 
 @pytest.fixture(name="locals_content")
@@ -8,7 +8,7 @@ import pytest
 
 from repo_utils import REPO_ROOT
 from opentofu_config import TEST_AWS_REGION
-from opentofu_drift import check_resource_exists, get_planned_creates
+from opentofu_drift import check_resources_exist, get_planned_creates
 
 
 BOOTSTRAP_DIR = REPO_ROOT / "src" / "bootstrap"
@@ -52,10 +52,8 @@ def test_no_orphaned_resources():
     if not creates:
         return  # Nothing to check
 
-    orphaned = []
-    for resource in creates:
-        if check_resource_exists(resource["type"], resource["name"], TEST_AWS_REGION):
-            orphaned.append(resource)
+    existence = check_resources_exist(creates, TEST_AWS_REGION)
+    orphaned = [r for r, exists in zip(creates, existence) if exists]
 
     if orphaned:
         msg = "\nOrphaned resources detected:\n"
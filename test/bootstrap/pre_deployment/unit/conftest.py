@@ -0,0 +1,26 @@
+"""Pytest fixtures for bootstrap pre-deployment unit tests."""
+import pytest
+
+
+@pytest.fixture(scope="session", name="backend_tf_content")
+def fixture_backend_tf_content(bootstrap_dir):
+    """Provide backend.tf file content."""
+    return (bootstrap_dir / "backend.tf").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session", name="providers_tf_content")
+def fixture_providers_tf_content(bootstrap_dir):
+    """Provide providers.tf file content."""
+    return (bootstrap_dir / "providers.tf").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session", name="shared_tf_content")
+def fixture_shared_tf_content(bootstrap_dir):
+    """Provide shared.tf file content."""
+    return (bootstrap_dir / "shared.tf").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session", name="locals_tf_content")
+def fixture_locals_tf_content(bootstrap_dir):
+    """Provide locals.tf file content."""
+    return (bootstrap_dir / "locals.tf").read_text(encoding="utf-8")
@@ -1,37 +1,31 @@
 """Pre-deployment unit tests for bootstrap backend.tf configuration."""
 
 
-def test_backend_uses_s3_backend(bootstrap_dir):
+def test_backend_uses_s3_backend(backend_tf_content):
     """Test that backend.tf uses S3 backend."""
-    content = (bootstrap_dir / "backend.tf").read_text()
-    assert 'backend "s3"' in content
+    assert 'backend "s3"' in backend_tf_content
 
 
-def test_backend_bucket_name(bootstrap_dir):
+def test_backend_bucket_name(backend_tf_content):
     """Test that backend uses the correct S3 bucket."""
-    content = (bootstrap_dir / "backend.tf").read_text()
-    assert 'bucket       = "deltahdl-opentofu-state-us-east-2"' in content
+    assert 'bucket       = "deltahdl-opentofu-state-us-east-2"' in backend_tf_content
 
 
-def test_backend_key_path(bootstrap_dir):
+def test_backend_key_path(backend_tf_content):
     """Test that backend uses the correct state file key path."""
-    content = (bootstrap_dir / "backend.tf").read_text()
-    assert 'key          = "bootstrap/terraform.tfstate"' in content
+    assert 'key          = "bootstrap/terraform.tfstate"' in backend_tf_content
 
 
-def test_backend_region(bootstrap_dir):
+def test_backend_region(backend_tf_content):
     """Test that backend uses the correct AWS region."""
-    content = (bootstrap_dir / "backend.tf").read_text()
-    assert 'region       = "us-east-2"' in content
+    assert 'region       = "us-east-2"' in backend_tf_content
 
 
-def test_backend_encryption_enabled(bootstrap_dir):
+def test_backend_encryption_enabled(backend_tf_content):
     """Test that backend has encryption enabled."""
-    content = (bootstrap_dir / "backend.tf").read_text()
-    assert "encrypt      = true" in content
+    assert "encrypt      = true" in backend_tf_content
 
 
-def test_backend_uses_lockfile(bootstrap_dir):
+def test_backend_uses_lockfile(backend_tf_content):
     """Test that backend uses lockfile for state locking."""
-    content = (bootstrap_dir / "backend.tf").read_text()
-    assert "use_lockfile = true" in content
+    assert "use_lockfile = true" in backend_tf_content
@@ -1,4 +1,5 @@
 """Pre-deployment unit tests for bootstrap locals.tf configuration."""
+import pytest
 
 
 def test_opentofu_tfvars_file_exists(bootstrap_dir):
@@ -6,29 +7,19 @@ def test_opentofu_tfvars_file_exists(bootstrap_dir):
     assert (bootstrap_dir / "opentofu.tfvars").exists()
 
 
-def test_config_has_name_for_cloudtrail(config):
-    """Test that config has name_for_cloudtrail."""
-    assert 'name_for_cloudtrail' in config
-
-
-def test_config_has_name_for_cloudtrail_iam_role(config):
-    """Test that config has name_for_cloudtrail_iam_role."""
-    assert 'name_for_cloudtrail_iam_role' in config
-
-
-def test_config_has_name_for_cloudtrail_log_group(config):
-    """Test that config has name_for_cloudtrail_log_group."""
-    assert 'name_for_cloudtrail_log_group' in config
-
-
-def test_config_has_hosted_zone_id(config):
-    """Test that config has hosted_zone_id."""
-    assert 'hosted_zone_id' in config
-
-
-def test_config_has_name_for_github_actions_role(config):
-    """Test that config has name_for_github_actions_role."""
-    assert 'name_for_github_actions_role' in config
+@pytest.mark.parametrize(
+    "key",
+    [
+        'name_for_cloudtrail',
+        'name_for_cloudtrail_iam_role',
+        'name_for_cloudtrail_log_group',
+        'hosted_zone_id',
+        'name_for_github_actions_role',
+    ],
+)
+def test_config_has_key(config, key):
+    """Test that config has the expected key."""
+    assert key in config
 
 
 def test_hosted_zone_id_starts_with_z(config):
@@ -36,25 +27,21 @@ def test_hosted_zone_id_starts_with_z(config):
     assert config['hosted_zone_id'].startswith('Z')
 
 
-def test_locals_has_name_for_opentofu_state_bucket(bootstrap_dir):
-    """Test that locals.tf references name_for_opentofu_state_bucket."""
-    content = (bootstrap_dir / "locals.tf").read_text()
-    assert 'name_for_opentofu_state_bucket' in content
-
-
-def test_locals_has_resource_prefix(bootstrap_dir):
-    """Test that locals.tf defines resource_prefix from common module."""
-    content = (bootstrap_dir / "locals.tf").read_text()
-    assert 'resource_prefix' in content
-
-
-def test_locals_github_actions_role_uses_prefix(bootstrap_dir):
-    """Test that GitHub Actions role name uses resource_prefix."""
-    content = (bootstrap_dir / "locals.tf").read_text()
-    assert '${local.resource_prefix}GitHubActionsRole' in content
-
-
-def test_locals_cloudtrail_iam_role_uses_prefix(bootstrap_dir):
-    """Test that CloudTrail IAM role name uses resource_prefix."""
-    content = (bootstrap_dir / "locals.tf").read_text()
-    assert '${local.resource_prefix}CloudTrailLogsRole' in content
+@pytest.mark.parametrize(
+    "substring",
+    [
+        'name_for_opentofu_state_bucket',
+        'resource_prefix',
+        '${local.resource_prefix}GitHubActionsRole',
+        '${local.resource_prefix}CloudTrailLogsRole',
+    ],
+    ids=[
+        "has_name_for_opentofu_state_bucket",
+        "has_resource_prefix",
+        "github_actions_role_uses_prefix",
+        "cloudtrail_iam_role_uses_prefix",
+    ],
+)
+def test_locals_contains(locals_tf_content, substring):
+    """Test that locals.tf contains the expected definition or reference."""
+    assert substring in locals_tf_content
@@ -1,25 +1,21 @@
 """Pre-deployment unit tests for bootstrap providers.tf configuration."""
 
 
-def test_opentofu_version_constraint(bootstrap_dir):
+def test_opentofu_version_constraint(providers_tf_content):
     """Test that OpenTofu version constraint is >= 1.11.0."""
-    content = (bootstrap_dir / "providers.tf").read_text()
-    assert 'required_version = ">= 1.11.0"' in content
+    assert 'required_version = ">= 1.11.0"' in providers_tf_content
 
 
-def test_aws_provider_source(bootstrap_dir):
+def test_aws_provider_source(providers_tf_content):
     """Test that AWS provider uses hashicorp/aws source."""
-    content = (bootstrap_dir / "providers.tf").read_text()
-    assert 'source  = "hashicorp/aws"' in content
+    assert 'source  = "hashicorp/aws"' in providers_tf_content
 
 
-def test_aws_provider_version_constraint(bootstrap_dir):
+def test_aws_provider_version_constraint(providers_tf_content):
     """Test that AWS provider version constraint is ~> 5.0."""
-    content = (bootstrap_dir / "providers.tf").read_text()
-    assert 'version = "~> 5.0"' in content
+    assert 'version = "~> 5.0"' in providers_tf_content
 
 
-def test_aws_provider_uses_local_region(bootstrap_dir):
+def test_aws_provider_uses_local_region(providers_tf_content):
     """Test that AWS provider uses local.aws_region for region."""
-    content = (bootstrap_dir / "providers.tf").read_text()
-    assert "region = local.aws_region" in content
+    assert "region = local.aws_region" in providers_tf_content
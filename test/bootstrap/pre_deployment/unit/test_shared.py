@@ -6,13 +6,11 @@ def test_shared_module_exists(bootstrap_dir):
     assert (bootstrap_dir / "shared.tf").exists()
 
 
-def test_shared_module_uses_common_source(bootstrap_dir):
+def test_shared_module_uses_common_source(shared_tf_content):
     """Test that shared module references the correct source path."""
-    content = (bootstrap_dir / "shared.tf").read_text()
-    assert 'source = "../../lib/opentofu/common"' in content
+    assert 'source = "../../lib/opentofu/common"' in shared_tf_content
 
 
-def test_shared_module_name_is_common(bootstrap_dir):
+def test_shared_module_name_is_common(shared_tf_content):
     """Test that shared module is named 'common'."""
-    content = (bootstrap_dir / "shared.tf").read_text()
-    assert 'module "common"' in content
+    assert 'module "common"' in shared_tf_content
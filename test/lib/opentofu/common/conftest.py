@@ -1,14 +1,16 @@
 """Pytest fixtures for common module tests."""
+from test.lib.opentofu.conftest import MODULE_PATHS
+
 import pytest
 
 
-@pytest.fixture(name="module_path")
-def fixture_module_path(modules_dir):
+@pytest.fixture(name="module_path", scope="module")
+def fixture_module_path():
     """Provide path to common module directory."""
-    return modules_dir / "common"
+    return MODULE_PATHS["common"]
 
 
-@pytest.fixture(name="locals_tf_content")
+@pytest.fixture(name="locals_tf_content", scope="module")
 def fixture_locals_tf_content(module_path):
     """Provide locals.tf file content."""
     with open(module_path / "locals.tf", encoding="utf-8") as f:
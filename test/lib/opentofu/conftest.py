@@ -1,32 +1,51 @@
 """Shared fixtures and utilities for OpenTofu module tests."""
+import re
+
 import pytest
 from repo_utils import REPO_ROOT
 
 MODULES_DIR = REPO_ROOT / "lib" / "opentofu"
+MODULE_PATHS = {name: MODULES_DIR / name for name in ("common", "s3_bucket")}
+
+_BLOCK_LABEL_RE = re.compile(r'^(output|variable) "([^"]+)"', re.MULTILINE)
 
 
-@pytest.fixture(name="modules_dir")
-def fixture_modules_dir():
-    """Provide path to OpenTofu modules directory."""
-    return MODULES_DIR
+def _declared_labels(content, block_type):
+    """Collect the labels of all top-level blocks of one type in one scan."""
+    return frozenset(
+        label for kind, label in _BLOCK_LABEL_RE.findall(content)
+        if kind == block_type
+    )
 
 
-@pytest.fixture(name="main_tf_content")
+@pytest.fixture(name="main_tf_content", scope="module")
 def fixture_main_tf_content(module_path):
     """Provide main.tf file content."""
     with open(module_path / "main.tf", encoding="utf-8") as f:
         return f.read()
 
 
-@pytest.fixture(name="variables_tf_content")
+@pytest.fixture(name="variables_tf_content", scope="module")
 def fixture_variables_tf_content(module_path):
     """Provide variables.tf file content."""
     with open(module_path / "variables.tf", encoding="utf-8") as f:
         return f.read()
 
 
-@pytest.fixture(name="outputs_tf_content")
+@pytest.fixture(name="outputs_tf_content", scope="module")
 def fixture_outputs_tf_content(module_path):
     """Provide outputs.tf file content."""
     with open(module_path / "outputs.tf", encoding="utf-8") as f:
         return f.read()
+
+
+@pytest.fixture(name="declared_variables", scope="module")
+def fixture_declared_variables(variables_tf_content):
+    """Provide the names of all variables declared in variables.tf."""
+    return _declared_labels(variables_tf_content, "variable")
+
+
+@pytest.fixture(name="declared_outputs", scope="module")
+def fixture_declared_outputs(outputs_tf_content):
+    """Provide the names of all outputs declared in outputs.tf."""
+    return _declared_labels(outputs_tf_content, "output")
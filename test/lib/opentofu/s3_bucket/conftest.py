@@ -1,8 +1,10 @@
 """Pytest fixtures for s3_bucket module tests."""
+from test.lib.opentofu.conftest import MODULE_PATHS
+
 import pytest
 
 
-@pytest.fixture(name="module_path")
-def fixture_module_path(modules_dir):
+@pytest.fixture(name="module_path", scope="module")
+def fixture_module_path():
     """Provide path to s3_bucket module directory."""
-    return modules_dir / "s3_bucket"
+    return MODULE_PATHS["s3_bucket"]
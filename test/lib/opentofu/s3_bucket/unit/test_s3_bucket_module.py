@@ -62,26 +62,26 @@ def test_s3_bucket_logging_is_optional(main_tf_content):
     assert 'count = var.central_logs_bucket != null' in main_tf_content
 
 
-def test_versioning_enabled_variable_exists(variables_tf_content):
+def test_versioning_enabled_variable_exists(declared_variables):
     """Test that versioning_enabled variable exists."""
-    assert 'variable "versioning_enabled"' in variables_tf_content
+    assert "versioning_enabled" in declared_variables
 
 
-def test_bucket_name_variable_exists(variables_tf_content):
+def test_bucket_name_variable_exists(declared_variables):
     """Test that bucket_name variable exists."""
-    assert 'variable "bucket_name"' in variables_tf_content
+    assert "bucket_name" in declared_variables
 
 
-def test_central_logs_bucket_variable_exists(variables_tf_content):
+def test_central_logs_bucket_variable_exists(declared_variables):
     """Test that central_logs_bucket variable exists."""
-    assert 'variable "central_logs_bucket"' in variables_tf_content
+    assert "central_logs_bucket" in declared_variables
 
 
-def test_bucket_id_output_exists(outputs_tf_content):
+def test_bucket_id_output_exists(declared_outputs):
     """Test that bucket_id output exists."""
-    assert 'output "bucket_id"' in outputs_tf_content
+    assert "bucket_id" in declared_outputs
 
 
-def test_bucket_arn_output_exists(outputs_tf_content):
+def test_bucket_arn_output_exists(declared_outputs):
     """Test that bucket_arn output exists."""
-    assert 'output "bucket_arn"' in outputs_tf_content
+    assert "bucket_arn" in declared_outputs
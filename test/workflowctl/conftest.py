@@ -11,9 +11,7 @@ tests, use pytest_plugins = ['test_fixtures.unit'] or ['test_fixtures.aws'].
 import importlib.util
 import json
 import sys
-import tempfile
-from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Generator
 
 import pytest
 
@@ -41,8 +39,15 @@ sys.path.insert(0, str(WORKFLOWCTL_DIR))
 
 
 def _load_module(name: str):
-    """Load a module from the workflowctl directory."""
+    """Load a module from the workflowctl directory.
+
+    Reuses the module if it was already loaded from the same file (e.g.
+    imported by another workflowctl module) instead of executing it again.
+    """
     module_path = WORKFLOWCTL_DIR / f"{name}.py"
+    loaded = sys.modules.get(name)
+    if loaded is not None and getattr(loaded, "__file__", None) == str(module_path):
+        return loaded
     spec = importlib.util.spec_from_file_location(name, module_path)
     if spec is None or spec.loader is None:
         raise ImportError(f"Could not load {name} module")
@@ -64,83 +69,90 @@ _compute_roots_module = _load_module("compute_roots")
 _dispatch_workflow_module = _load_module("dispatch_workflow")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def workflowctl():
     """Provide access to the workflowctl module."""
     return _workflowctl_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def utils():
     """Provide access to the utils module."""
     return _utils_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cancel():
     """Provide access to the cancel module."""
     return _cancel_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def compute_descendants():
     """Provide access to the compute_descendants module."""
     return _compute_descendants_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dispatch_roots():
     """Provide access to the dispatch_roots module."""
     return _dispatch_roots_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_changed_files():
     """Provide access to the get_changed_files module."""
     return _get_changed_files_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_running():
     """Provide access to the get_running module."""
     return _get_running_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def compute_roots():
     """Provide access to the compute_roots module."""
     return _compute_roots_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dispatch_workflow():
     """Provide access to the dispatch_workflow module."""
     return _dispatch_workflow_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_graph() -> Dict[str, Dict[str, Any]]:
     """Provide a standard dependency graph for testing.
 
     This graph represents a linear chain:
     bootstrap -> www_redirect
 
-    Each workflow has name, depends_on, and paths fields.
+    Each workflow has name, depends_on, and paths fields. The graph is
+    shared across the session and must be treated as read-only.
     """
-    return SAMPLE_GRAPH.copy()
+    return SAMPLE_GRAPH
 
 
-@pytest.fixture
-def sample_graph_file():
-    """Create a temporary graph file for testing CLI commands.
+@pytest.fixture(scope="session")
+def sample_graph_file(tmp_path_factory) -> str:
+    """Create a graph file for testing CLI commands.
 
-    Writes SAMPLE_GRAPH to a temporary JSON file and yields the path.
-    The file is cleaned up after the test completes.
+    Writes SAMPLE_GRAPH to a JSON file once per session and returns the
+    path. Tests only read the file, so it is shared.
     """
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False
-    ) as graph_file:
-        json.dump(SAMPLE_GRAPH, graph_file)
-        graph_file.flush()
-        yield graph_file.name
-    Path(graph_file.name).unlink(missing_ok=True)
+    graph_file = tmp_path_factory.mktemp("graph") / "sample_graph.json"
+    graph_file.write_text(json.dumps(SAMPLE_GRAPH), encoding="utf-8")
+    return str(graph_file)
+
+
+@pytest.fixture(autouse=True)
+def clear_workflow_file_caches() -> Generator[None, None, None]:
+    """Make each test scan and read its own workflow files."""
+    _utils_module.list_workflow_files.cache_clear()
+    _utils_module.read_workflow_file.cache_clear()
+    yield
+    _utils_module.list_workflow_files.cache_clear()
+    _utils_module.read_workflow_file.cache_clear()
@@ -1,6 +1,9 @@
 """Pytest fixtures for workflowctl pre-deployment integration tests."""
 
 import json
+import os
+from pathlib import Path
+from typing import Optional
 
 import pytest
 
@@ -11,17 +14,46 @@ GRAPH_PATH = REPO_ROOT / "etc" / "workflow_dependencies.json"
 WORKFLOWS_DIR = REPO_ROOT / ".github" / "workflows"
 
 
-@pytest.fixture(scope="module")
-def dependency_graph() -> dict:
+@pytest.fixture(scope="module", name="dependency_graph")
+def dependency_graph_fixture() -> dict:
     """Load the workflow dependency graph."""
     with open(GRAPH_PATH, encoding="utf-8") as graph_file:
         return json.load(graph_file)
 
 
+@pytest.fixture(scope="module")
+def graph_keys(dependency_graph: dict) -> frozenset:
+    """Get the set of workflow keys defined in the dependency graph."""
+    return frozenset(dependency_graph)
+
+
 @pytest.fixture(scope="module")
 def workflow_files() -> set:
     """Get set of workflow file stems (without .yml extension)."""
+    with os.scandir(WORKFLOWS_DIR) as entries:
+        return {
+            entry.name[:-4] for entry in entries
+            if entry.name.endswith(".yml") and not entry.name.startswith(".")
+        }
+
+
+def _extract_workflow_name(workflow_file: Path) -> Optional[str]:
+    """Read a workflow file's top-level name: value without parsing YAML."""
+    with open(workflow_file, encoding="utf-8") as wf_handle:
+        for line in wf_handle:
+            if line.startswith("name:"):
+                return line[5:].strip().strip('"').strip("'")
+    return None
+
+
+@pytest.fixture(scope="session")
+def workflow_name_map() -> dict:
+    """Map each workflow file stem to its top-level name: value.
+
+    Files without a top-level name: line map to None.
+    """
     return {
-        f.stem for f in WORKFLOWS_DIR.glob("*.yml")
-        if not f.stem.startswith(".")
+        workflow_file.stem: _extract_workflow_name(workflow_file)
+        for workflow_file in WORKFLOWS_DIR.glob("*.yml")
+        if not workflow_file.stem.startswith(".")
     }
@@ -5,19 +5,13 @@ workflow files in .github/workflows/. Per docs/tenets/tests/PRE_DEPLOYMENT_INTEG
 Layer 1 contract tests validate cross-file compatibility without making AWS calls.
 """
 
-import yaml
-
-from repo_utils import REPO_ROOT
-
-
-WORKFLOWS_DIR = REPO_ROOT / ".github" / "workflows"
+from collections import deque
 
 
 def test_all_graph_keys_have_workflow_files(
-    dependency_graph: dict, workflow_files: set
+    graph_keys: frozenset, workflow_files: set
 ) -> None:
     """Verify each graph key has a corresponding workflow file."""
-    graph_keys = set(dependency_graph.keys())
     missing = graph_keys - workflow_files
 
     assert not missing, (
@@ -50,9 +44,10 @@ def test_first_path_is_workflow_file(dependency_graph: dict) -> None:
     )
 
 
-def test_all_dependencies_are_valid_keys(dependency_graph: dict) -> None:
+def test_all_dependencies_are_valid_keys(
+    dependency_graph: dict, graph_keys: frozenset
+) -> None:
     """Verify all depends_on values reference existing graph keys."""
-    graph_keys = set(dependency_graph.keys())
     invalid_deps = []
 
     for key, config in dependency_graph.items():
@@ -66,7 +61,7 @@ def test_all_dependencies_are_valid_keys(dependency_graph: dict) -> None:
 
 
 def test_graph_names_match_workflow_yaml_names(
-    dependency_graph: dict
+    dependency_graph: dict, workflow_name_map: dict
 ) -> None:
     """Verify graph 'name' values match workflow file 'name:' fields."""
     mismatches = []
@@ -76,19 +71,13 @@ def test_graph_names_match_workflow_yaml_names(
         if not graph_name:
             continue
 
-        workflow_file = WORKFLOWS_DIR / f"{key}.yml"
-        if not workflow_file.exists():
+        if key not in workflow_name_map:
             continue  # Covered by other test
 
-        with open(workflow_file, encoding="utf-8") as wf_handle:
-            try:
-                workflow_yaml = yaml.safe_load(wf_handle)
-            except yaml.YAMLError:
-                mismatches.append(f"{key}: could not parse YAML")
-                continue
-
-        yaml_name = workflow_yaml.get("name")
-        if yaml_name != graph_name:
+        yaml_name = workflow_name_map[key]
+        if yaml_name is None:
+            mismatches.append(f"{key}: no top-level name: line")
+        elif yaml_name != graph_name:
             mismatches.append(
                 f"{key}: graph name '{graph_name}' != "
                 f"workflow name '{yaml_name}'"
@@ -102,36 +91,26 @@ def test_graph_names_match_workflow_yaml_names(
 
 def test_graph_has_no_cycles(dependency_graph: dict) -> None:
     """Verify the dependency graph is acyclic."""
-    # Use DFS to detect cycles
-    visited: set = set()
-    rec_stack: set = set()
-    cycles: list = []
-
-    def has_cycle(node: str, path: list) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
-
-        for dep in dependency_graph.get(node, {}).get("depends_on", []):
+    # Kahn's algorithm: any node never reaching in-degree zero is on,
+    # or downstream of, a cycle
+    in_degree = {key: 0 for key in dependency_graph}
+    dependents: dict = {key: [] for key in dependency_graph}
+    for key, config in dependency_graph.items():
+        for dep in config.get("depends_on", []):
             if dep not in dependency_graph:
                 continue  # Invalid dep, covered by other test
-
-            if dep not in visited:
-                if has_cycle(dep, path + [dep]):
-                    return True
-            elif dep in rec_stack:
-                cycle_start = path.index(dep) if dep in path else 0
-                cycles.append(
-                    " -> ".join(path[cycle_start:] + [dep])
-                )
-                return True
-
-        rec_stack.remove(node)
-        return False
-
-    for key in dependency_graph:
-        if key not in visited:
-            has_cycle(key, [key])
-
-    assert not cycles, (
-        "Cyclic dependencies detected:\n  " + "\n  ".join(cycles)
+            in_degree[key] += 1
+            dependents[dep].append(key)
+
+    queue = deque(key for key, degree in in_degree.items() if degree == 0)
+    while queue:
+        node = queue.popleft()
+        for dependent in dependents[node]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    cyclic = sorted(key for key, degree in in_degree.items() if degree > 0)
+    assert not cyclic, (
+        f"Cyclic dependencies detected involving: {cyclic}"
     )
@@ -38,6 +38,22 @@ class TestGetAllDescendants:
         utils.get_all_descendants("bootstrap", sample_graph, cache)
         assert "www_redirect" in cache
 
+    def test_shared_descendant_counted_once(self, utils) -> None:
+        """Test diamond-shaped graph yields each descendant once."""
+        # a -> (b, c) -> d
+        diamond_graph = {"a": {"depends_on": []}, "b": {"depends_on": ["a"]},
+                         "c": {"depends_on": ["a"]}, "d": {"depends_on": ["b", "c"]}}
+        descendants = utils.get_all_descendants("a", diamond_graph)
+        assert descendants == {"b", "c", "d"}
+
+    def test_deep_chain_exceeds_recursion_limit(self, utils) -> None:
+        """Test chains deeper than the recursion limit are traversed."""
+        depth = sys.getrecursionlimit() + 100
+        chain_graph = {f"wf{i}": {"depends_on": [f"wf{i - 1}"] if i else []}
+                       for i in range(depth)}
+        descendants = utils.get_all_descendants("wf0", chain_graph)
+        assert len(descendants) == depth - 1
+
 
 class TestGetWorkflowsToCancel:
     """Tests for get_workflows_to_cancel function."""
@@ -113,6 +129,16 @@ class TestCancelRun:
         result = cancel.cancel_run("owner/repo", 123)
         assert result is True
 
+    @patch("cancel.subprocess.run")
+    def test_already_cancelled_is_success(self, mock_run: MagicMock, cancel) -> None:
+        """Test already cancelled run is treated as success."""
+        mock_run.return_value = MagicMock(
+            returncode=1,
+            stderr="Run 123 is already cancelled"
+        )
+        result = cancel.cancel_run("owner/repo", 123)
+        assert result is True
+
     @patch("cancel.subprocess.run")
     def test_other_error_is_failure(self, mock_run: MagicMock, cancel) -> None:
         """Test other errors return False."""
@@ -124,6 +150,23 @@ class TestCancelRun:
         assert result is False
 
 
+class TestCancelRuns:
+    """Tests for cancel_runs function."""
+
+    @patch("cancel.cancel_run")
+    def test_returns_results_in_run_order(
+        self, mock_cancel: MagicMock, cancel
+    ) -> None:
+        """Test per-run results are returned in the order of run IDs."""
+        mock_cancel.side_effect = lambda repo, run_id: run_id != 2
+        result = cancel.cancel_runs("owner/repo", [1, 2, 3])
+        assert result == [True, False, True]
+
+    def test_no_runs_returns_empty(self, cancel) -> None:
+        """Test empty run list returns empty results."""
+        assert cancel.cancel_runs("owner/repo", []) == []
+
+
 class TestGetCancelableRuns:
     """Tests for get_cancelable_runs function."""
 
@@ -136,7 +179,19 @@ class TestGetCancelableRuns:
             {"id": 1, "name": "Test", "run_number": 42, "extra": "ignored", "status": "in_progress"}
         ]
         result = cancel.get_cancelable_runs("owner/repo", "in_progress")
-        assert result == [{"id": 1, "name": "Test", "run_number": 42}]
+        assert result == [cancel.CancelableRun(1, "Test", 42)]
+
+    @patch("cancel.get_workflow_runs")
+    def test_filters_to_wanted_names(
+        self, mock_get_runs: MagicMock, cancel
+    ) -> None:
+        """Test that runs of unwanted workflows are dropped."""
+        mock_get_runs.return_value = [
+            {"id": 1, "name": "Keep", "run_number": 1},
+            {"id": 2, "name": "Drop", "run_number": 2},
+        ]
+        result = cancel.get_cancelable_runs("owner/repo", "in_progress", {"Keep"})
+        assert result == [cancel.CancelableRun(1, "Keep", 1)]
 
     @patch("cancel.get_workflow_runs")
     def test_handles_empty_runs(self, mock_get_runs: MagicMock, cancel) -> None:
@@ -8,7 +8,7 @@ with dependencies mocked, not cross-file compatibility.
 
 import json
 import sys
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 
 class TestCancelMain:
@@ -64,6 +64,25 @@ class TestCancelMain:
         with patch.object(sys, "argv", test_args):
             assert cancel.main() == 0
 
+    @patch("cancel.get_cancelable_runs")
+    def test_fetches_runs_of_workflows_to_cancel_only(
+        self, mock_get_runs, cancel, sample_graph_file
+    ) -> None:
+        """Main asks for runs of the display names it will cancel."""
+        mock_get_runs.return_value = []
+        test_args = [
+            "cancel", "--repo", "owner/repo",
+            "--changed-files", "src/www/redirect/test.py",
+            "--running", '["www_redirect"]',
+            "--graph", sample_graph_file,
+        ]
+        with patch.object(sys, "argv", test_args):
+            cancel.main()
+        assert mock_get_runs.call_args_list == [
+            call("owner/repo", "in_progress", {"WWW Redirect"}),
+            call("owner/repo", "queued", {"WWW Redirect"}),
+        ]
+
     @patch("cancel.cancel_run")
     @patch("cancel.get_cancelable_runs")
     def test_successful_cancel_exits_zero(
@@ -71,7 +90,7 @@ class TestCancelMain:
     ) -> None:
         """Main returns 0 when all cancellations succeed."""
         mock_get_runs.side_effect = [
-            [{"id": 123, "name": "WWW Redirect", "run_number": 1}],
+            [cancel.CancelableRun(123, "WWW Redirect", 1)],
             [],
         ]
         mock_cancel.return_value = True
@@ -91,7 +110,7 @@ class TestCancelMain:
     ) -> None:
         """Main returns 1 when a cancellation fails."""
         mock_get_runs.side_effect = [
-            [{"id": 123, "name": "WWW Redirect", "run_number": 1}],
+            [cancel.CancelableRun(123, "WWW Redirect", 1)],
             [],
         ]
         mock_cancel.return_value = False
@@ -1,181 +1,215 @@
 """Unit tests for compute_descendants.py."""
 
+import io
 import json
-import os
 import sys
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager, nullcontext, redirect_stdout
 from datetime import datetime, timezone
-from typing import Any, Generator
-from unittest.mock import patch, MagicMock
+from types import MappingProxyType
+from typing import Any, Callable, Generator, NamedTuple
+from unittest.mock import patch
 
+import pytest
 
-SAMPLE_GRAPH = {
+
+SAMPLE_GRAPH = MappingProxyType({
     "bootstrap": {"name": "Bootstrap", "depends_on": []},
     "www_redirect": {"name": "WWW Redirect", "depends_on": ["bootstrap"]},
-}
+})
 
 SAMPLE_WAITING: dict[str, Any] = {}
 
 FIXED_SINCE = datetime(2026, 1, 11, 2, 0, 0, tzinfo=timezone.utc)
 
+EXPECTED_ENDPOINT_FMT = "actions/workflows/{}.yml/runs"
+EXPECTED_STATUS_FILTER = "status=success"
+EXPECTED_CREATED_FILTER = "created=%3E%3D2026-01-11T02:00:00Z"
 
-def get_api_url_from_check_workflow(compute_descendants: Any, workflow_key: str) -> str:
-    """Helper to capture the API URL from check_workflow_completed."""
-    mock_result = MagicMock()
-    mock_result.stdout = ""
-    with patch("compute_descendants.subprocess.run", return_value=mock_result) as mock_run:
-        compute_descendants.check_workflow_completed(workflow_key, "owner/repo", FIXED_SINCE)
-    return mock_run.call_args[0][0][2]
-
-
-class TestParseArgs:
-    """Tests for parse_args function."""
-
-    def test_parses_workflow_argument(self, compute_descendants) -> None:
-        """Test that --workflow argument is parsed correctly."""
-        argv = ["prog", "--workflow", "bootstrap", "--repo", "o/r"]
-        with patch.object(sys, "argv", argv):
-            args = compute_descendants.parse_args()
-        assert args.workflow == "bootstrap"
-
-    def test_parses_repo_argument(self, compute_descendants) -> None:
-        """Test that --repo argument is parsed correctly."""
-        argv = ["prog", "--workflow", "test", "--repo", "owner/repo"]
-        with patch.object(sys, "argv", argv):
-            args = compute_descendants.parse_args()
-        assert args.repo == "owner/repo"
-
-    def test_graph_defaults_to_standard_path(self, compute_descendants) -> None:
-        """Test that --graph defaults to etc/workflow_dependencies.json."""
-        argv = ["prog", "--workflow", "test", "--repo", "o/r"]
-        with patch.object(sys, "argv", argv):
-            args = compute_descendants.parse_args()
-        assert args.graph == "etc/workflow_dependencies.json"
-
-    def test_parses_custom_graph_path(self, compute_descendants) -> None:
-        """Test that --graph argument is parsed correctly."""
-        argv = ["prog", "--workflow", "test", "--repo", "o/r", "--graph", "custom.json"]
-        with patch.object(sys, "argv", argv):
-            args = compute_descendants.parse_args()
-        assert args.graph == "custom.json"
-
-    def test_lookback_hours_defaults_to_24(self, compute_descendants) -> None:
-        """Test that --lookback-hours defaults to 24."""
-        argv = ["prog", "--workflow", "test", "--repo", "o/r"]
-        with patch.object(sys, "argv", argv):
-            args = compute_descendants.parse_args()
-        assert args.lookback_hours == 24
-
-    def test_parses_lookback_hours(self, compute_descendants) -> None:
-        """Test that --lookback-hours argument is parsed correctly."""
-        argv = ["prog", "--workflow", "test", "--repo", "o/r", "--lookback-hours", "48"]
-        with patch.object(sys, "argv", argv):
-            args = compute_descendants.parse_args()
-        assert args.lookback_hours == 48
-
-
-class TestFindDescendants:
-    """Tests for find_descendants function."""
-
-    def test_returns_empty_for_leaf_workflow(self, compute_descendants) -> None:
-        """Test that a leaf workflow has no descendants."""
-        result = compute_descendants.find_descendants(SAMPLE_GRAPH, "www_redirect")
-        assert result == []
-
-    def test_returns_direct_descendants(self, compute_descendants) -> None:
-        """Test that direct descendants are returned."""
-        result = compute_descendants.find_descendants(SAMPLE_GRAPH, "bootstrap")
-        assert result == ["www_redirect"]
-
-    def test_returns_empty_for_unknown_workflow(self, compute_descendants) -> None:
-        """Test that unknown workflow has no descendants."""
-        result = compute_descendants.find_descendants(SAMPLE_GRAPH, "unknown")
-        assert result == []
+MAIN_ARGV = ["prog", "--workflow", "bootstrap", "--repo", "o/r"]
 
 
-class TestCheckWorkflowCompleted:
-    """Tests for check_workflow_completed function."""
+class _RunResult(NamedTuple):
+    """The part of subprocess.CompletedProcess that the code under test reads."""
 
-    def test_returns_true_when_successful_run_exists(
-        self, compute_descendants
-    ) -> None:
-        """Test returns True when a successful run exists."""
-        mock_result = MagicMock()
-        mock_result.stdout = "12345\n"
-        since = datetime.now(timezone.utc)
+    stdout: str
 
-        with patch("compute_descendants.subprocess.run", return_value=mock_result):
-            result = compute_descendants.check_workflow_completed(
-                "Bootstrap", "owner/repo", since
-            )
-        assert result is True
 
-    def test_returns_false_when_no_successful_run(self, compute_descendants) -> None:
-        """Test returns False when no successful run exists."""
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        since = datetime.now(timezone.utc)
+def _recording_run(state: dict[str, Any]):
+    """Build a subprocess.run stand-in that records commands into state.
 
-        with patch("compute_descendants.subprocess.run", return_value=mock_result):
-            result = compute_descendants.check_workflow_completed(
-                "Bootstrap", "owner/repo", since
-            )
-        assert result is False
+    Each call appends its command to state["commands"] and returns
+    state["stdout"] (empty when unset).
+    """
+    state.setdefault("commands", [])
 
-    def test_returns_false_when_only_whitespace(self, compute_descendants) -> None:
-        """Test returns False when output is only whitespace."""
-        mock_result = MagicMock()
-        mock_result.stdout = "   \n"
-        since = datetime.now(timezone.utc)
+    def fake_run(cmd: list[str], **_kwargs: Any) -> _RunResult:
+        state["commands"].append(cmd)
+        return _RunResult(state.get("stdout", ""))
+
+    return fake_run
 
-        with patch("compute_descendants.subprocess.run", return_value=mock_result):
-            result = compute_descendants.check_workflow_completed(
-                "Bootstrap", "owner/repo", since
-            )
-        assert result is False
 
-    def test_uses_workflow_specific_api_endpoint(self, compute_descendants) -> None:
-        """Test that API call uses workflow-specific endpoint."""
-        api_url = get_api_url_from_check_workflow(compute_descendants, "www_redirect")
-        assert "actions/workflows/www_redirect.yml/runs" in api_url
+@pytest.fixture(name="fake_run")
+def fixture_fake_run(monkeypatch, compute_descendants) -> dict[str, Any]:
+    """Replace subprocess.run for compute_descendants with a recording fake.
 
-    def test_api_url_includes_status_filter(self, compute_descendants) -> None:
-        """Test that API URL includes status=success filter."""
-        api_url = get_api_url_from_check_workflow(compute_descendants, "bootstrap")
-        assert "status=success" in api_url
+    Set the returned dict's "stdout" to control the result; every command
+    run is appended to its "commands" list.
+    """
+    state: dict[str, Any] = {"stdout": ""}
+    monkeypatch.setattr(compute_descendants.subprocess, "run", _recording_run(state))
+    return state
 
-    def test_api_url_includes_created_filter(self, compute_descendants) -> None:
-        """Test that API URL includes created date filter."""
-        api_url = get_api_url_from_check_workflow(compute_descendants, "bootstrap")
-        assert "created=%3E%3D2026-01-11T02:00:00Z" in api_url
 
+def _buffering_open(files: dict[str, io.StringIO]) -> Callable[..., nullcontext]:
+    """Build an open() stand-in that writes each path into a StringIO in files."""
 
-class TestGetDependencyStatus:
-    """Tests for get_dependency_status function."""
+    def fake_open(path: str, *_args: Any, **_kwargs: Any) -> nullcontext:
+        return nullcontext(files.setdefault(path, io.StringIO()))
 
-    def test_single_dependency_returns_all_met(self, compute_descendants) -> None:
-        """Test returns all_met=True when only current workflow is dependency."""
-        graph: dict[str, Any] = {"child": {"depends_on": ["parent"]}}
-        result = compute_descendants.get_dependency_status(
-            graph, "child", "parent", "owner/repo", 24
+    return fake_open
+
+
+@pytest.fixture(name="written_files")
+def fixture_written_files(monkeypatch, compute_descendants) -> dict[str, io.StringIO]:
+    """Redirect files opened by compute_descendants into in-memory buffers.
+
+    Returns a dict mapping each opened path to the StringIO that received
+    its writes.
+    """
+    files: dict[str, io.StringIO] = {}
+    monkeypatch.setattr(
+        compute_descendants, "open", _buffering_open(files), raising=False
+    )
+    return files
+
+
+@pytest.fixture(name="api_urls", scope="module")
+def fixture_api_urls(compute_descendants) -> dict[str, str]:
+    """Capture the API URL check_workflow_completed builds for each workflow."""
+    state: dict[str, Any] = {}
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            compute_descendants.subprocess, "run", _recording_run(state)
         )
-        assert result["all_met"] is True
+        for workflow_key in SAMPLE_GRAPH:
+            compute_descendants.check_workflow_completed(
+                workflow_key, "owner/repo", FIXED_SINCE
+            )
+    return {
+        workflow_key: command[2]
+        for workflow_key, command in zip(SAMPLE_GRAPH, state["commands"])
+    }
+
+
+@pytest.mark.parametrize(
+    "extra_argv,attr,expected",
+    [
+        (["--workflow", "bootstrap", "--repo", "o/r"], "workflow", "bootstrap"),
+        (["--workflow", "test", "--repo", "owner/repo"], "repo", "owner/repo"),
+        (["--workflow", "test", "--repo", "o/r"], "graph",
+         "etc/workflow_dependencies.json"),
+        (["--workflow", "test", "--repo", "o/r", "--graph", "custom.json"],
+         "graph", "custom.json"),
+        (["--workflow", "test", "--repo", "o/r"], "lookback_hours", 24),
+        (["--workflow", "test", "--repo", "o/r", "--lookback-hours", "48"],
+         "lookback_hours", 48),
+    ],
+    ids=[
+        "workflow", "repo", "graph_default", "graph_custom",
+        "lookback_hours_default", "lookback_hours_custom",
+    ],
+)
+def test_parse_args_parses_argument(
+    compute_descendants, extra_argv, attr, expected
+) -> None:
+    """Test that each argument is parsed or defaulted correctly."""
+    with patch.object(sys, "argv", ["prog"] + extra_argv):
+        args = compute_descendants.parse_args()
+    assert getattr(args, attr) == expected
+
+
+@pytest.mark.parametrize(
+    "workflow,expected",
+    [
+        ("www_redirect", []),
+        ("bootstrap", ["www_redirect"]),
+        ("unknown", []),
+    ],
+    ids=["leaf", "direct_descendants", "unknown"],
+)
+def test_find_descendants(compute_descendants, workflow, expected) -> None:
+    """Test that direct descendants of a workflow are returned."""
+    result = compute_descendants.find_descendants(SAMPLE_GRAPH, workflow)
+    assert result == expected
 
-    def test_single_dependency_has_satisfied_list(self, compute_descendants) -> None:
-        """Test that current workflow is in satisfied list."""
-        graph: dict[str, Any] = {"child": {"depends_on": ["parent"]}}
-        result = compute_descendants.get_dependency_status(
-            graph, "child", "parent", "owner/repo", 24
+
+class TestCheckWorkflowCompleted:
+    """Tests for check_workflow_completed function."""
+
+    def test_returns_true_when_successful_run_exists(
+        self, compute_descendants, fake_run
+    ) -> None:
+        """Test returns True when a successful run exists."""
+        fake_run["stdout"] = "12345\n"
+
+        result = compute_descendants.check_workflow_completed(
+            "Bootstrap", "owner/repo", FIXED_SINCE
         )
-        assert "parent" in result["satisfied"]
+        assert result is True
 
-    def test_single_dependency_has_empty_missing(self, compute_descendants) -> None:
-        """Test returns empty missing list for single dependency."""
-        graph: dict[str, Any] = {"child": {"depends_on": ["parent"]}}
-        result = compute_descendants.get_dependency_status(
-            graph, "child", "parent", "owner/repo", 24
+    def test_returns_false_when_no_successful_run(
+        self, compute_descendants, fake_run
+    ) -> None:
+        """Test returns False when no successful run exists."""
+        fake_run["stdout"] = ""
+
+        result = compute_descendants.check_workflow_completed(
+            "Bootstrap", "owner/repo", FIXED_SINCE
         )
-        assert result["missing"] == []
+        assert result is False
+
+    def test_returns_false_when_only_whitespace(
+        self, compute_descendants, fake_run
+    ) -> None:
+        """Test returns False when output is only whitespace."""
+        fake_run["stdout"] = "   \n"
+
+        result = compute_descendants.check_workflow_completed(
+            "Bootstrap", "owner/repo", FIXED_SINCE
+        )
+        assert result is False
+
+    @pytest.mark.parametrize(
+        "workflow_key,expected",
+        [
+            ("www_redirect", EXPECTED_ENDPOINT_FMT.format("www_redirect")),
+            ("bootstrap", EXPECTED_STATUS_FILTER),
+            ("bootstrap", EXPECTED_CREATED_FILTER),
+        ],
+        ids=["workflow_endpoint", "status_filter", "created_filter"],
+    )
+    def test_api_url_contains(self, api_urls, workflow_key, expected) -> None:
+        """Test that the API URL targets the workflow with the right filters."""
+        assert expected in api_urls[workflow_key]
+
+
+@pytest.fixture(name="single_dep_status", scope="module")
+def fixture_single_dep_status(compute_descendants) -> dict[str, Any]:
+    """Dependency status of a workflow whose only dependency just completed."""
+    graph = MappingProxyType({"child": {"depends_on": ["parent"]}})
+    return compute_descendants.get_dependency_status(
+        graph, "child", "parent", "owner/repo", 24
+    )
+
+
+@pytest.mark.parametrize(
+    "field,expected",
+    [("all_met", True), ("satisfied", ["parent"]), ("missing", [])],
+)
+def test_single_dependency_status(single_dep_status, field, expected) -> None:
+    """Test status when the current workflow is the only dependency."""
+    assert single_dep_status[field] == expected
 
 
 class TestComputeDescendantsStatus:
@@ -207,129 +241,111 @@ class TestWriteGithubOutput:
     """Tests for write_github_output function."""
 
     def test_writes_nothing_without_github_output_env(
-        self, compute_descendants
+        self, compute_descendants, written_files, monkeypatch
     ) -> None:
         """Test that nothing is written when GITHUB_OUTPUT is not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("GITHUB_OUTPUT", None)
-            compute_descendants.write_github_output(["a"], {"b": {"missing": ["c"]}})
-        assert True  # No exception means success
+        monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+        compute_descendants.write_github_output(["a"], {"b": {"missing": ["c"]}})
+        assert not written_files
 
     def test_writes_ready_to_output_file(
-        self, compute_descendants, tmp_path
+        self, compute_descendants, written_files, monkeypatch
     ) -> None:
         """Test that ready list is written to GITHUB_OUTPUT."""
-        output_file = tmp_path / "output"
-        output_file.touch()
-
-        with patch.dict(os.environ, {"GITHUB_OUTPUT": str(output_file)}):
-            compute_descendants.write_github_output(["www_redirect"], {})
+        monkeypatch.setenv("GITHUB_OUTPUT", "output")
+        compute_descendants.write_github_output(["www_redirect"], {})
 
-        assert 'ready=["www_redirect"]' in output_file.read_text()
+        assert 'ready=["www_redirect"]' in written_files["output"].getvalue()
 
     def test_writes_waiting_to_output_file(
-        self, compute_descendants, tmp_path
+        self, compute_descendants, written_files, monkeypatch
     ) -> None:
         """Test that waiting dict is written to GITHUB_OUTPUT."""
-        output_file = tmp_path / "output"
-        output_file.touch()
-
         waiting = {"www_redirect": {"missing": ["bootstrap"], "satisfied": []}}
-        with patch.dict(os.environ, {"GITHUB_OUTPUT": str(output_file)}):
-            compute_descendants.write_github_output([], waiting)
+        monkeypatch.setenv("GITHUB_OUTPUT", "output")
+        compute_descendants.write_github_output([], waiting)
+
+        assert "www_redirect" in written_files["output"].getvalue()
 
-        assert "www_redirect" in output_file.read_text()
+
+@pytest.fixture(name="ready_summary", scope="module")
+def fixture_ready_summary(compute_descendants) -> str:
+    """Step summary written once for bootstrap with one ready descendant."""
+    files: dict[str, io.StringIO] = {}
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            compute_descendants, "open", _buffering_open(files), raising=False
+        )
+        monkeypatch.setenv("GITHUB_STEP_SUMMARY", "summary")
+        compute_descendants.write_step_summary("bootstrap", ["www_redirect"], {})
+    return files["summary"].getvalue()
 
 
 class TestWriteStepSummary:
     """Tests for write_step_summary function."""
 
     def test_writes_nothing_without_github_step_summary_env(
-        self, compute_descendants
+        self, compute_descendants, written_files, monkeypatch
     ) -> None:
         """Test that nothing is written when GITHUB_STEP_SUMMARY is not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("GITHUB_STEP_SUMMARY", None)
-            compute_descendants.write_step_summary("bootstrap", ["a"], {})
-        assert True  # No exception means success
-
-    def test_writes_workflow_name_to_summary(
-        self, compute_descendants, tmp_path
-    ) -> None:
-        """Test that completed workflow name is written to summary."""
-        summary_file = tmp_path / "summary"
-        summary_file.touch()
-
-        with patch.dict(os.environ, {"GITHUB_STEP_SUMMARY": str(summary_file)}):
-            compute_descendants.write_step_summary("bootstrap", [], {})
+        monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+        compute_descendants.write_step_summary("bootstrap", ["a"], {})
+        assert not written_files
 
-        assert "bootstrap" in summary_file.read_text()
+    @pytest.mark.parametrize(
+        "expected", ["bootstrap", "www_redirect"], ids=["workflow", "ready"]
+    )
+    def test_ready_summary_contains(self, ready_summary, expected) -> None:
+        """Test that the summary names the completed and ready workflows."""
+        assert expected in ready_summary
 
-    def test_writes_ready_workflow_to_summary(
-        self, compute_descendants, tmp_path
+    def test_shows_no_descendants_message(
+        self, compute_descendants, written_files, monkeypatch
     ) -> None:
-        """Test that ready descendant workflow is shown in summary."""
-        summary_file = tmp_path / "summary"
-        summary_file.touch()
+        """Test that message is shown when no descendants."""
+        monkeypatch.setenv("GITHUB_STEP_SUMMARY", "summary")
+        compute_descendants.write_step_summary("leaf", [], {})
 
-        with patch.dict(os.environ, {"GITHUB_STEP_SUMMARY": str(summary_file)}):
-            compute_descendants.write_step_summary("bootstrap", ["www_redirect"], {})
+        assert "No descendants found" in written_files["summary"].getvalue()
 
-        assert "www_redirect" in summary_file.read_text()
 
-    def test_shows_no_descendants_message(
-        self, compute_descendants, tmp_path
-    ) -> None:
-        """Test that message is shown when no descendants."""
-        summary_file = tmp_path / "summary"
-        summary_file.touch()
+@contextmanager
+def _run_main_with_graph() -> Generator[None, None, None]:
+    """Context manager for running main for bootstrap with mocked graph."""
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(sys, "argv", MAIN_ARGV))
+        stack.enter_context(patch(
+            "compute_descendants.load_dependency_graph", return_value=SAMPLE_GRAPH
+        ))
+        env = stack.enter_context(pytest.MonkeyPatch.context())
+        env.delenv("GITHUB_OUTPUT", raising=False)
+        env.delenv("GITHUB_STEP_SUMMARY", raising=False)
+        yield
 
-        with patch.dict(os.environ, {"GITHUB_STEP_SUMMARY": str(summary_file)}):
-            compute_descendants.write_step_summary("leaf", [], {})
 
-        assert "No descendants found" in summary_file.read_text()
+@pytest.fixture(name="main_result", scope="module")
+def fixture_main_result(compute_descendants) -> tuple[int, dict[str, Any]]:
+    """Run main once for the bootstrap workflow.
+
+    Returns the exit code and the parsed JSON written to stdout.
+    """
+    stdout = io.StringIO()
+    with _run_main_with_graph(), redirect_stdout(stdout):
+        exit_code = compute_descendants.main()
+    return exit_code, json.loads(stdout.getvalue())
 
 
 class TestMain:
     """Tests for main function."""
 
-    @contextmanager
-    def _run_main_with_graph(
-        self, _compute_descendants: Any, workflow: str = "bootstrap"
-    ) -> Generator[None, None, None]:
-        """Context manager for running main with mocked graph."""
-        argv = ["prog", "--workflow", workflow, "--repo", "o/r"]
-        with patch.object(sys, "argv", argv):
-            with patch(
-                "compute_descendants.load_dependency_graph", return_value=SAMPLE_GRAPH
-            ):
-                with patch.dict(os.environ, {}, clear=True):
-                    os.environ.pop("GITHUB_OUTPUT", None)
-                    os.environ.pop("GITHUB_STEP_SUMMARY", None)
-                    yield
-
-    def test_returns_0_on_success(self, compute_descendants) -> None:
+    def test_returns_0_on_success(self, main_result) -> None:
         """Test returns 0 on success."""
-        with self._run_main_with_graph(compute_descendants):
-            result = compute_descendants.main()
-        assert result == 0
+        assert main_result[0] == 0
 
-    def test_stdout_contains_completed_workflow(
-        self, compute_descendants, capsys
-    ) -> None:
+    def test_stdout_contains_completed_workflow(self, main_result) -> None:
         """Test that stdout contains completed_workflow field."""
-        with self._run_main_with_graph(compute_descendants):
-            compute_descendants.main()
+        assert main_result[1]["completed_workflow"] == "bootstrap"
 
-        output = json.loads(capsys.readouterr().out)
-        assert output["completed_workflow"] == "bootstrap"
-
-    def test_stdout_contains_ready_descendants(
-        self, compute_descendants, capsys
-    ) -> None:
+    def test_stdout_contains_ready_descendants(self, main_result) -> None:
         """Test that stdout contains ready descendants."""
-        with self._run_main_with_graph(compute_descendants):
-            compute_descendants.main()
-
-        output = json.loads(capsys.readouterr().out)
-        assert output["ready"] == ["www_redirect"]
+        assert main_result[1]["ready"] == ["www_redirect"]
@@ -1,6 +1,5 @@
 """Unit tests for compute_roots.py."""
 
-import io
 import sys
 from test.workflowctl.conftest import SAMPLE_GRAPH
 from unittest.mock import patch
@@ -72,6 +71,13 @@ class TestFileMatchesPatterns:
         """Test with empty pattern list."""
         assert not compute_roots.file_matches_patterns("any/file.txt", [])
 
+    def test_double_star_prefix_match_among_multiple_patterns(
+        self, compute_roots
+    ) -> None:
+        """Test ** directory prefix matching survives combining patterns."""
+        patterns = ["docs/*.md", "src/api/**/*.py"]
+        assert compute_roots.file_matches_patterns("src/api/v1/test", patterns)
+
 
 class TestGetAllAncestors:
     """Tests for get_all_ancestors function."""
@@ -98,6 +104,14 @@ class TestGetAllAncestors:
         compute_roots.get_all_ancestors("www_redirect", SAMPLE_GRAPH, cache)
         assert "bootstrap" in cache
 
+    def test_deep_chain_exceeds_recursion_limit(self, compute_roots) -> None:
+        """Test chains deeper than the recursion limit are traversed."""
+        depth = sys.getrecursionlimit() + 100
+        chain_graph = {f"wf{i}": {"depends_on": [f"wf{i - 1}"] if i else []}
+                       for i in range(depth)}
+        ancestors = compute_roots.get_all_ancestors(f"wf{depth - 1}", chain_graph)
+        assert len(ancestors) == depth - 1
+
 
 class TestGetAffectedWorkflows:
     """Tests for get_affected_workflows function."""
@@ -132,6 +146,27 @@ class TestGetAffectedWorkflows:
         affected = compute_roots.get_affected_workflows(changed, SAMPLE_GRAPH)
         assert affected == set()
 
+    def test_nested_directory_pattern(self, compute_roots) -> None:
+        """Test file deep under a dir/** pattern affects its workflow."""
+        changed = ["src/www/redirect/sub/dir/main.tf"]
+        affected = compute_roots.get_affected_workflows(changed, SAMPLE_GRAPH)
+        assert affected == {"www_redirect"}
+
+    def test_glob_pattern(self, compute_roots) -> None:
+        """Test patterns that are not dir/** still match as globs."""
+        graph = {"docs": {"depends_on": [], "paths": ["docs/*.md"]}}
+        affected = compute_roots.get_affected_workflows(["docs/guide.md"], graph)
+        assert affected == {"docs"}
+
+    def test_glob_pattern_shared_by_workflows(self, compute_roots) -> None:
+        """Test a file matching globs of several workflows affects all of them."""
+        graph = {
+            "docs": {"depends_on": [], "paths": ["docs/*.md"]},
+            "site": {"depends_on": [], "paths": ["*.md", "site/**/*.html"]},
+        }
+        affected = compute_roots.get_affected_workflows(["docs/guide.md"], graph)
+        assert affected == {"docs", "site"}
+
 
 class TestComputeRootWorkflows:
     """Tests for compute_root_workflows function."""
@@ -149,6 +184,13 @@ class TestComputeRootWorkflows:
         # Only bootstrap should be root; www_redirect will cascade
         assert roots == ["bootstrap"]
 
+    def test_reuses_given_ancestor_cache(self, compute_roots) -> None:
+        """Test that ancestor sets already in the cache are not recomputed."""
+        changed = ["src/bootstrap/main.tf", "src/www/redirect/main.tf"]
+        cache: dict[str, set[str]] = {"www_redirect": set()}
+        roots = compute_roots.compute_root_workflows(changed, SAMPLE_GRAPH, cache)
+        assert roots == ["bootstrap", "www_redirect"]
+
     def test_independent_workflows(self, compute_roots) -> None:
         """Test multiple independent workflow changes."""
         # Create a graph with two independent branches
@@ -160,7 +202,7 @@ class TestComputeRootWorkflows:
         }
         changed = ["src/a/file.tf", "src/b/file.tf"]
         roots = compute_roots.compute_root_workflows(changed, graph)
-        assert sorted(roots) == ["a", "b"]
+        assert roots == ["a", "b"]
 
     def test_leaf_workflow_only(self, compute_roots) -> None:
         """Test changing only a leaf workflow returns it as root."""
@@ -203,7 +245,7 @@ class TestDiamondDependency:
         """Test changing both middle nodes returns both as roots."""
         changed = ["src/left/file.tf", "src/right/file.tf"]
         roots = compute_roots.compute_root_workflows(changed, diamond_graph)
-        assert sorted(roots) == ["left", "right"]
+        assert roots == ["left", "right"]
 
     def test_diamond_one_middle_and_bottom(self, diamond_graph: dict, compute_roots) -> None:
         """Test changing one middle and bottom returns only middle."""
@@ -430,132 +472,76 @@ class TestComputeExecutionPlanLevels:
             2, ["a", "b"], ["c"])
 
 
-class TestOutputSlots:
-    """Tests for output_slots function."""
-
-    def test_exact_slots_outputs_count(self, compute_roots) -> None:
-        """Test outputting exact number of slots shows correct count."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots(["a", "b"], 2)
-            output = mock_stdout.getvalue()
-        assert "count=2" in output
-
-    def test_exact_slots_outputs_first_key(self, compute_roots) -> None:
-        """Test outputting exact number of slots shows first key."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots(["a", "b"], 2)
-            output = mock_stdout.getvalue()
-        assert "key_01=a" in output
-
-    def test_exact_slots_outputs_second_key(self, compute_roots) -> None:
-        """Test outputting exact number of slots shows second key."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots(["a", "b"], 2)
-            output = mock_stdout.getvalue()
-        assert "key_02=b" in output
-
-    def test_more_slots_outputs_count(self, compute_roots) -> None:
-        """Test more slots than items shows correct count."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots(["a"], 4)
-            output = mock_stdout.getvalue()
-        assert "count=1" in output
-
-    def test_more_slots_outputs_first_key(self, compute_roots) -> None:
-        """Test more slots than items shows first key."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots(["a"], 4)
-            output = mock_stdout.getvalue()
-        assert "key_01=a" in output
-
-    def test_more_slots_outputs_empty_second_key(self, compute_roots) -> None:
-        """Test more slots than items shows empty second key."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots(["a"], 4)
-            output = mock_stdout.getvalue()
-        assert "key_02=" in output
-
-    def test_more_slots_outputs_empty_third_key(self, compute_roots) -> None:
-        """Test more slots than items shows empty third key."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots(["a"], 4)
-            output = mock_stdout.getvalue()
-        assert "key_03=" in output
-
-    def test_more_slots_outputs_empty_fourth_key(self, compute_roots) -> None:
-        """Test more slots than items shows empty fourth key."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots(["a"], 4)
-            output = mock_stdout.getvalue()
-        assert "key_04=" in output
-
-    def test_empty_list_outputs_count_zero(self, compute_roots) -> None:
-        """Test outputting with no items shows count zero."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots([], 2)
-            output = mock_stdout.getvalue()
-        assert "count=0" in output
-
-    def test_empty_list_outputs_empty_first_key(self, compute_roots) -> None:
-        """Test outputting with no items shows empty first key."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots([], 2)
-            output = mock_stdout.getvalue()
-        assert "key_01=" in output
-
-    def test_empty_list_outputs_empty_second_key(self, compute_roots) -> None:
-        """Test outputting with no items shows empty second key."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_slots([], 2)
-            output = mock_stdout.getvalue()
-        assert "key_02=" in output
+@pytest.mark.parametrize(
+    "items,num_slots,fragment",
+    [
+        (["a", "b"], 2, "count=2"),
+        (["a", "b"], 2, "key_01=a"),
+        (["a", "b"], 2, "key_02=b"),
+        (["a"], 4, "count=1"),
+        (["a"], 4, "key_01=a"),
+        (["a"], 4, "key_02="),
+        (["a"], 4, "key_03="),
+        (["a"], 4, "key_04="),
+        ([], 2, "count=0"),
+        ([], 2, "key_01="),
+        ([], 2, "key_02="),
+    ],
+    ids=[
+        "exact_count", "exact_first_key", "exact_second_key",
+        "more_count", "more_first_key", "more_empty_second_key",
+        "more_empty_third_key", "more_empty_fourth_key",
+        "empty_count", "empty_first_key", "empty_second_key",
+    ],
+)
+def test_output_slots_contains(
+    compute_roots, capsys, items, num_slots, fragment
+) -> None:
+    """Test that output_slots prints the count and one line per slot."""
+    compute_roots.output_slots(items, num_slots)
+    assert fragment in capsys.readouterr().out.splitlines()
 
 
 class TestOutputResults:
     """Tests for output_results function."""
 
-    def test_output_json_object(self, compute_roots) -> None:
+    def test_output_json_object(self, compute_roots, capsys) -> None:
         """Test JSON object output format."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_results(["a", "b"])
-            output = mock_stdout.getvalue().strip()
+        compute_roots.output_results(["a", "b"])
+        output = capsys.readouterr().out.strip()
         assert output == '{"workflows": ["a", "b"]}'
 
-    def test_output_indexed(self, compute_roots) -> None:
+    def test_output_indexed(self, compute_roots, capsys) -> None:
         """Test indexed JSON output format."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_results(["a", "b"], indexed=True)
-            output = mock_stdout.getvalue().strip()
+        compute_roots.output_results(["a", "b"], indexed=True)
+        output = capsys.readouterr().out.strip()
         expected = '{"workflows": [{"idx": "01", "name": "a"}, {"idx": "02", "name": "b"}]}'
         assert output == expected
 
-    def test_output_empty(self, compute_roots) -> None:
+    def test_output_empty(self, compute_roots, capsys) -> None:
         """Test output with empty list."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_results([])
-            output = mock_stdout.getvalue().strip()
+        compute_roots.output_results([])
+        output = capsys.readouterr().out.strip()
         assert output == '{"workflows": []}'
 
 
 class TestOutputLevelsIndexed:
     """Tests for output_levels_indexed function."""
 
-    def test_single_level(self, compute_roots) -> None:
+    def test_single_level(self, compute_roots, capsys) -> None:
         """Test output with single level."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_levels_indexed([["a", "b"]])
-            output = mock_stdout.getvalue().strip()
+        compute_roots.output_levels_indexed([["a", "b"]])
+        output = capsys.readouterr().out.strip()
         expected = (
             '{"workflows": [{"idx": "01", "level": 1, "name": "a"}, '
             '{"idx": "02", "level": 1, "name": "b"}]}'
         )
         assert output == expected
 
-    def test_multiple_levels(self, compute_roots) -> None:
+    def test_multiple_levels(self, compute_roots, capsys) -> None:
         """Test output with multiple levels."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_levels_indexed([["a"], ["b", "c"], ["d"]])
-            output = mock_stdout.getvalue().strip()
+        compute_roots.output_levels_indexed([["a"], ["b", "c"], ["d"]])
+        output = capsys.readouterr().out.strip()
         expected = (
             '{"workflows": [{"idx": "01", "level": 1, "name": "a"}, '
             '{"idx": "02", "level": 2, "name": "b"}, '
@@ -564,11 +550,10 @@ class TestOutputLevelsIndexed:
         )
         assert output == expected
 
-    def test_empty_levels(self, compute_roots) -> None:
+    def test_empty_levels(self, compute_roots, capsys) -> None:
         """Test output with empty levels list."""
-        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
-            compute_roots.output_levels_indexed([])
-            output = mock_stdout.getvalue().strip()
+        compute_roots.output_levels_indexed([])
+        output = capsys.readouterr().out.strip()
         assert output == '{"workflows": []}'
 
 
@@ -649,7 +634,7 @@ class TestComputeMergeRoots:
         new_roots = ["right"]
         result = compute_roots.compute_merge_roots(running, new_roots, graph)
         # Both are independent branches, both should be roots
-        assert sorted(result) == ["left", "right"]
+        assert result == ["left", "right"]
 
     def test_running_at_common_ancestor(self, compute_roots) -> None:
         """Test when running workflow is ancestor of new changes.
@@ -689,7 +674,7 @@ class TestComputeMergeRoots:
         new_roots = ["a", "b"]
         result = compute_roots.compute_merge_roots(running, new_roots, graph)
         # a is ancestor of c, so only a and b are roots
-        assert sorted(result) == ["a", "b"]
+        assert result == ["a", "b"]
 
     def test_unknown_running_workflow_filtered(self, compute_roots) -> None:
         """Test that unknown workflow keys are filtered out."""
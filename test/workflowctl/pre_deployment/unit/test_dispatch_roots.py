@@ -1,58 +1,68 @@
 """Unit tests for dispatch_roots.py."""
 import sys
+from typing import Any, Generator
+from unittest.mock import DEFAULT, MagicMock, mock_open, patch
 
-from unittest.mock import MagicMock, mock_open, patch
+import pytest
 
+# Case ids shared by the commit-message tag predicate tests
+TAG_CASE_IDS = ["flag", "commit_tag", "commit_tag_case_insensitive", "no_conditions"]
 
-class TestShouldTriggerDescendants:
-    """Tests for should_trigger_descendants function."""
 
-    def test_returns_true_when_flag_is_true(self, dispatch_roots) -> None:
-        """Test returns True when trigger_flag is True."""
-        assert dispatch_roots.should_trigger_descendants(True, "") is True
-
-    def test_returns_true_when_commit_has_tag(self, dispatch_roots) -> None:
-        """Test returns True when commit message has [trigger descendants]."""
-        assert dispatch_roots.should_trigger_descendants(
-            False, "feat: add feature [trigger descendants]"
-        ) is True
-
-    def test_returns_true_when_commit_has_tag_case_insensitive(self, dispatch_roots) -> None:
-        """Test [Trigger Descendants] tag is case insensitive."""
-        assert dispatch_roots.should_trigger_descendants(
-            False, "feat: add feature [Trigger Descendants]"
-        ) is True
-
-    def test_returns_false_when_no_conditions_met(self, dispatch_roots) -> None:
-        """Test returns False when no conditions are met."""
-        assert dispatch_roots.should_trigger_descendants(
-            False, "feat: normal commit"
-        ) is False
+@pytest.mark.parametrize(
+    "flag,message,expected",
+    [
+        (True, "", True),
+        (False, "feat: add feature [trigger descendants]", True),
+        (False, "feat: add feature [Trigger Descendants]", True),
+        (False, "feat: normal commit", False),
+    ],
+    ids=TAG_CASE_IDS,
+)
+def test_should_trigger_descendants(dispatch_roots, flag, message, expected) -> None:
+    """Test descendants are triggered by the flag or a commit message tag."""
+    assert dispatch_roots.should_trigger_descendants(flag, message) is expected
 
 
 class TestWorkflowFileExists:
     """Tests for workflow_file_exists function."""
 
-    @patch("os.path.isfile")
-    def test_returns_true_when_file_exists(self, mock_isfile: MagicMock, dispatch_roots) -> None:
+    def test_returns_true_when_file_exists(
+        self, dispatch_roots, utils, monkeypatch
+    ) -> None:
         """Test returns True when workflow file exists."""
-        mock_isfile.return_value = True
+        monkeypatch.setattr(
+            utils, "list_workflow_files", lambda _dir: frozenset({"bootstrap"})
+        )
         assert dispatch_roots.workflow_file_exists("bootstrap") is True
 
-    @patch("os.path.isfile")
-    def test_checks_correct_path(self, mock_isfile: MagicMock, dispatch_roots) -> None:
-        """Test checks correct workflow file path."""
-        mock_isfile.return_value = True
-        dispatch_roots.workflow_file_exists("bootstrap")
-        mock_isfile.assert_called_once_with(".github/workflows/bootstrap.yml")
-        assert True  # Explicit pass
+    def test_lists_only_yml_files(self, utils, tmp_path) -> None:
+        """Test that only .yml files in the workflows directory are listed."""
+        (tmp_path / "bootstrap.yml").touch()
+        (tmp_path / "notes.txt").touch()
+        (tmp_path / "nested.yml").mkdir()
+        assert utils.list_workflow_files(str(tmp_path)) == frozenset({"bootstrap"})
 
-    @patch("os.path.isfile")
-    def test_returns_false_when_file_missing(self, mock_isfile: MagicMock, dispatch_roots) -> None:
+    def test_returns_false_when_file_missing(
+        self, dispatch_roots, utils, monkeypatch
+    ) -> None:
         """Test returns False when workflow file is missing."""
-        mock_isfile.return_value = False
+        monkeypatch.setattr(
+            utils, "list_workflow_files", lambda _dir: frozenset({"bootstrap"})
+        )
         assert dispatch_roots.workflow_file_exists("missing") is False
 
+    def test_missing_workflows_dir_is_not_cached(
+        self, dispatch_roots, tmp_path, monkeypatch
+    ) -> None:
+        """Test that a missing .github/workflows directory is scanned again."""
+        monkeypatch.chdir(tmp_path)
+        dispatch_roots.workflow_file_exists("bootstrap")
+        workflows_dir = tmp_path / ".github" / "workflows"
+        workflows_dir.mkdir(parents=True)
+        (workflows_dir / "bootstrap.yml").touch()
+        assert dispatch_roots.workflow_file_exists("bootstrap") is True
+
 
 class TestWorkflowAcceptsInput:
     """Tests for workflow_accepts_input function."""
@@ -90,122 +100,102 @@ on:
         with patch("builtins.open", side_effect=IOError("File not found")):
             assert dispatch_roots.workflow_accepts_input("missing", "trigger_descendants") is False
 
+    def test_reads_workflow_file_once_for_several_inputs(self, dispatch_roots) -> None:
+        """Test that checking two inputs of one workflow opens its file once."""
+        content = "trigger_descendants:\ninvalidate_cloudfront:\n"
+        with patch("builtins.open", mock_open(read_data=content)) as mocked_open:
+            dispatch_roots.workflow_accepts_input("test", "trigger_descendants")
+            dispatch_roots.workflow_accepts_input("test", "invalidate_cloudfront")
+        assert mocked_open.call_count == 1
+
+    def test_missing_workflow_file_is_not_cached(
+        self, dispatch_roots, tmp_path, monkeypatch
+    ) -> None:
+        """Test that a workflow file missing at first is read once present."""
+        monkeypatch.chdir(tmp_path)
+        dispatch_roots.workflow_accepts_input("test", "trigger_descendants")
+        workflows_dir = tmp_path / ".github" / "workflows"
+        workflows_dir.mkdir(parents=True)
+        (workflows_dir / "test.yml").write_text("trigger_descendants:\n", encoding="utf-8")
+        assert dispatch_roots.workflow_accepts_input("test", "trigger_descendants") is True
+
 
 class TestDispatchWorkflow:
     """Tests for dispatch_workflow function."""
 
-    @patch("dispatch_roots.workflow_accepts_input")
-    @patch("dispatch_roots.dispatch_gh_workflow")
-    def test_dispatches_returns_true_on_success(
-        self,
-        mock_dispatch: MagicMock,
-        _mock_accepts: MagicMock,
-        dispatch_roots
-    ) -> None:
+    @pytest.fixture(name="stubs")
+    def fixture_stubs(self, dispatch_roots) -> Generator[dict[str, Any], None, None]:
+        """Replace the input check and gh dispatch with mocks in one patch."""
+        with patch.multiple(
+            dispatch_roots,
+            workflow_accepts_input=DEFAULT,
+            dispatch_gh_workflow=DEFAULT,
+        ) as stubs:
+            yield stubs
+
+    def test_dispatches_returns_true_on_success(self, stubs, dispatch_roots) -> None:
         """Test dispatch returns True on success."""
-        mock_dispatch.return_value = True
+        stubs["dispatch_gh_workflow"].return_value = True
         result = dispatch_roots.dispatch_workflow("test", "owner/repo", False, False)
         assert result is True
 
-    @patch("dispatch_roots.workflow_accepts_input")
-    @patch("dispatch_roots.dispatch_gh_workflow")
     def test_dispatches_without_flag_when_trigger_false(
-        self,
-        mock_dispatch: MagicMock,
-        _mock_accepts: MagicMock,
-        dispatch_roots
+        self, stubs, dispatch_roots
     ) -> None:
         """Test dispatch passes None extra_args when trigger_descendants False."""
-        mock_dispatch.return_value = True
+        stubs["dispatch_gh_workflow"].return_value = True
         dispatch_roots.dispatch_workflow("test", "owner/repo", False, False)
-        call_args = mock_dispatch.call_args
+        call_args = stubs["dispatch_gh_workflow"].call_args
         assert call_args[0][2] is None
 
-    @patch("dispatch_roots.workflow_accepts_input")
-    @patch("dispatch_roots.dispatch_gh_workflow")
     def test_dispatches_with_flag_when_workflow_accepts(
-        self,
-        mock_dispatch: MagicMock,
-        mock_accepts: MagicMock,
-        dispatch_roots
+        self, stubs, dispatch_roots
     ) -> None:
         """Test dispatch passes trigger_descendants flag when accepted."""
-        mock_accepts.return_value = True
-        mock_dispatch.return_value = True
+        stubs["workflow_accepts_input"].return_value = True
+        stubs["dispatch_gh_workflow"].return_value = True
         dispatch_roots.dispatch_workflow("test", "owner/repo", True, False)
-        call_args = mock_dispatch.call_args
+        call_args = stubs["dispatch_gh_workflow"].call_args
         assert call_args[0][2] == ["-f", "trigger_descendants=true"]
 
-    @patch("dispatch_roots.workflow_accepts_input")
-    @patch("dispatch_roots.dispatch_gh_workflow")
     def test_dispatches_without_flag_when_workflow_rejects(
-        self,
-        mock_dispatch: MagicMock,
-        mock_accepts: MagicMock,
-        dispatch_roots
+        self, stubs, dispatch_roots
     ) -> None:
         """Test dispatch passes None when workflow rejects trigger_descendants."""
-        mock_accepts.return_value = False
-        mock_dispatch.return_value = True
+        stubs["workflow_accepts_input"].return_value = False
+        stubs["dispatch_gh_workflow"].return_value = True
         dispatch_roots.dispatch_workflow("test", "owner/repo", True, False)
-        call_args = mock_dispatch.call_args
+        call_args = stubs["dispatch_gh_workflow"].call_args
         assert call_args[0][2] is None
 
-    @patch("dispatch_roots.workflow_accepts_input")
-    @patch("dispatch_roots.dispatch_gh_workflow")
-    def test_returns_false_on_dispatch_failure(
-        self,
-        mock_dispatch: MagicMock,
-        _mock_accepts: MagicMock,
-        dispatch_roots
-    ) -> None:
+    def test_returns_false_on_dispatch_failure(self, stubs, dispatch_roots) -> None:
         """Test returns False when dispatch fails."""
-        mock_dispatch.return_value = False
+        stubs["dispatch_gh_workflow"].return_value = False
         result = dispatch_roots.dispatch_workflow("test", "owner/repo", False, False)
         assert result is False
 
-    @patch("dispatch_roots.workflow_accepts_input")
-    @patch("dispatch_roots.dispatch_gh_workflow")
-    def test_includes_invalidate_cloudfront_flag(
-        self,
-        mock_dispatch: MagicMock,
-        mock_accepts: MagicMock,
-        dispatch_roots
-    ) -> None:
+    def test_includes_invalidate_cloudfront_flag(self, stubs, dispatch_roots) -> None:
         """Test dispatch includes invalidate_cloudfront flag when True and accepted."""
-        mock_accepts.return_value = True
-        mock_dispatch.return_value = True
+        stubs["workflow_accepts_input"].return_value = True
+        stubs["dispatch_gh_workflow"].return_value = True
         dispatch_roots.dispatch_workflow("test", "owner/repo", False, True)
-        call_args = mock_dispatch.call_args
+        call_args = stubs["dispatch_gh_workflow"].call_args
         assert call_args[0][2] == ["-f", "invalidate_cloudfront=true"]
 
 
-class TestShouldInvalidateCloudfront:
-    """Tests for should_invalidate_cloudfront function."""
-
-    def test_returns_true_when_flag_is_true(self, dispatch_roots) -> None:
-        """Test returns True when invalidate_flag is True."""
-        result = dispatch_roots.should_invalidate_cloudfront(True, "any message")
-        assert result is True
-
-    def test_returns_true_when_commit_has_tag(self, dispatch_roots) -> None:
-        """Test returns True when commit has [invalidate cloudfront] tag."""
-        result = dispatch_roots.should_invalidate_cloudfront(
-            False, "fix: update [invalidate cloudfront]"
-        )
-        assert result is True
-
-    def test_returns_true_case_insensitive(self, dispatch_roots) -> None:
-        """Test tag matching is case insensitive."""
-        result = dispatch_roots.should_invalidate_cloudfront(
-            False, "[INVALIDATE CLOUDFRONT]"
-        )
-        assert result is True
-
-    def test_returns_false_when_no_conditions_met(self, dispatch_roots) -> None:
-        """Test returns False when no conditions are met."""
-        result = dispatch_roots.should_invalidate_cloudfront(False, "normal commit")
-        assert result is False
+@pytest.mark.parametrize(
+    "flag,message,expected",
+    [
+        (True, "any message", True),
+        (False, "fix: update [invalidate cloudfront]", True),
+        (False, "[INVALIDATE CLOUDFRONT]", True),
+        (False, "normal commit", False),
+    ],
+    ids=TAG_CASE_IDS,
+)
+def test_should_invalidate_cloudfront(dispatch_roots, flag, message, expected) -> None:
+    """Test CloudFront is invalidated by the flag or a commit message tag."""
+    assert dispatch_roots.should_invalidate_cloudfront(flag, message) is expected
 
 
 def test_main_calls_compute_merge_roots_with_running(
@@ -218,27 +208,14 @@ def test_main_calls_compute_merge_roots_with_running(
         "--graph", "g.json", "--repo", "o/r",
         "--changed-files", "", "--commit-message", ""
     ]
-    with patch.object(sys, "argv", argv):
-        with patch(
-            "dispatch_roots.load_graph_and_compute_roots",
-            return_value=(graph, ["a"], None)
-        ):
-            with patch(
-                "dispatch_roots.parse_running_workflows",
-                return_value=(["b"], None)
-            ):
-                with patch(
-                    "dispatch_roots.compute_merge_roots",
-                    return_value=["a"]
-                ) as mock_merge:
-                    with patch(
-                        "dispatch_roots.workflow_file_exists",
-                        return_value=True
-                    ):
-                        with patch(
-                            "dispatch_roots.dispatch_workflow",
-                            return_value=True
-                        ):
-                            dispatch_roots.main()
-    mock_merge.assert_called_once_with(["b"], ["a"], graph)
+    stubs = {
+        "load_graph_and_compute_roots": MagicMock(return_value=(graph, ["a"], None)),
+        "parse_running_workflows": MagicMock(return_value=(["b"], None)),
+        "compute_merge_roots": MagicMock(return_value=["a"]),
+        "workflow_file_exists": MagicMock(return_value=True),
+        "dispatch_workflow": MagicMock(return_value=True),
+    }
+    with patch.object(sys, "argv", argv), patch.multiple(dispatch_roots, **stubs):
+        dispatch_roots.main()
+    stubs["compute_merge_roots"].assert_called_once_with(["b"], ["a"], graph)
     assert True  # Explicit pass
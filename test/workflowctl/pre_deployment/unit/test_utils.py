@@ -1,6 +1,7 @@
 """Unit tests for utils.py."""
 
 import argparse
+import json
 import sys
 from unittest.mock import patch, MagicMock, mock_open
 
@@ -146,6 +147,18 @@ class TestLoadDependencyGraph:
             result = utils.load_dependency_graph("test.json")
         assert result == {"workflow1": {"name": "Test"}}
 
+    def test_dependency_names_share_key_objects(self, utils) -> None:
+        """Test that depends_on entries are the same objects as graph keys."""
+        # Multi-character names: json.loads builds new string objects for
+        # them, unlike the single characters CPython always caches
+        mock_data = json.dumps({
+            "bootstrap": {"depends_on": []},
+            "www_redirect": {"depends_on": ["bootstrap"]},
+        })
+        with patch("builtins.open", mock_open(read_data=mock_data)):
+            result = utils.load_dependency_graph("test.json")
+        assert result["www_redirect"]["depends_on"][0] is next(iter(result))
+
     def test_raises_on_file_not_found(self, utils) -> None:
         """Test that FileNotFoundError is raised for missing file."""
         with patch("builtins.open", side_effect=FileNotFoundError()):
@@ -309,3 +322,30 @@ class TestFileMatchesPatternDoublestar:
         """Test ** pattern requires correct directory prefix."""
         result = utils.file_matches_pattern("srcapi/file.py", "src/api/**")
         assert result is False
+
+
+class TestCollectWithDescendants:
+    """Tests for collect_with_descendants function."""
+
+    def test_includes_roots_and_descendants(self, utils, sample_graph) -> None:
+        """Test that roots are collected along with their descendants."""
+        collected = utils.collect_with_descendants(["bootstrap"], sample_graph)
+        assert collected == {"bootstrap", "www_redirect"}
+
+    def test_shared_descendants_of_roots_collected_once(self, utils) -> None:
+        """Test that descendants reachable from several roots are merged."""
+        graph = {"a": {"depends_on": []}, "b": {"depends_on": []},
+                 "c": {"depends_on": ["a", "b"]}}
+        assert utils.collect_with_descendants(["a", "b"], graph) == {"a", "b", "c"}
+
+
+class TestGetDependencies:
+    """Tests for get_dependencies function."""
+
+    def test_returns_direct_dependencies(self, utils, sample_graph) -> None:
+        """Test that a workflow's depends_on entries are returned."""
+        assert utils.get_dependencies(sample_graph, "www_redirect") == ["bootstrap"]
+
+    def test_unknown_workflow_has_no_dependencies(self, utils, sample_graph) -> None:
+        """Test that a workflow missing from the graph has no dependencies."""
+        assert not utils.get_dependencies(sample_graph, "missing")